@@ -26,6 +26,8 @@ basic operations including:
 - Transaction management
 """
 
+import contextlib
+import io
 import sys
 import os
 
@@ -100,6 +102,11 @@ def main():
             print(f"  Note: Table might already exist: {e}")
         print()
         
+        # Group the writes below into a single transaction so the server
+        # makes them durable once at commit instead of once per statement
+        if not conn.autocommit:
+            conn.begin()
+        
         # Step 6: Insert some data
         print("Inserting test data...")
         users_data = [
@@ -110,11 +117,8 @@ def main():
             (5, "Eve", 32)
         ]
         
-        for user_id, name, age in users_data:
-            cursor.execute(
-                "INSERT INTO users VALUES (%s, %s, %s)",
-                (user_id, name, age)
-            )
+        # executemany() folds the rows into a single multi-row INSERT
+        cursor.executemany("INSERT INTO users VALUES (%s, %s, %s)", users_data)
         print(f"  Inserted {len(users_data)} users.")
         print()
         
@@ -128,6 +132,7 @@ def main():
         print()
         
         print("  Results:")
+        cursor.arraysize = 1000  # Iterate in batches of up to 1000 rows
         for row in cursor:
             print(f"    ID: {row[0]}, Name: {row[1]}, Age: {row[2]}")
         print()
@@ -206,4 +211,12 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    # Collect the output and write it once at the end instead of issuing a
+    # separate write for every print() call
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output):
+            main()
+    finally:
+        sys.stdout.write(output.getvalue())
+        sys.stdout.flush()
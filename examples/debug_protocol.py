@@ -17,6 +17,7 @@
 Debug script to inspect FlyDB protocol responses.
 """
 
+import asyncio
 import sys
 import os
 import json
@@ -24,11 +25,11 @@ import json
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import pyflydb
+from pyflydb import aio
 from pyflydb.protocol import create_query_message, MessageType
 
 
-def main():
+async def main():
     print("=" * 60)
     print("pyFlyDb - Protocol Debug")
     print("=" * 60)
@@ -42,54 +43,30 @@ def main():
     try:
         # Connect
         print("Connecting...")
-        conn = pyflydb.connect(host=host, port=port, user=user, password=password)
+        conn = await aio.connect(host=host, port=port, user=user, password=password)
         print("✓ Connected\n")
         
-        # Test 1: Simple SELECT to see response format
-        print("Test 1: Executing simple query...")
-        query_msg = create_query_message("SELECT 1 as test_col")
-        conn._send_message(query_msg)
-        response = conn._receive_message()
+        tests = [
+            ("Test 1: Executing simple query...", "SELECT 1 as test_col"),
+            ("Test 2: CREATE TABLE response...", "CREATE TABLE test_debug (id INT, value TEXT)"),
+            ("Test 3: INSERT response...", "INSERT INTO test_debug VALUES (1, 'hello')"),
+            ("Test 4: SELECT response...", "SELECT * FROM test_debug"),
+        ]
         
-        print(f"Response type: {response.msg_type}")
-        print(f"Response payload:")
-        print(json.dumps(response.payload, indent=2))
-        print()
+        # Run all queries concurrently; they are pipelined on the one
+        # connection and the server answers them in order
+        responses = await asyncio.gather(
+            *(conn.request(create_query_message(query)) for _, query in tests)
+        )
         
-        # Test 2: CREATE TABLE
-        print("Test 2: CREATE TABLE response...")
-        query_msg = create_query_message("CREATE TABLE test_debug (id INT, value TEXT)")
-        conn._send_message(query_msg)
-        response = conn._receive_message()
+        for (title, _), response in zip(tests, responses):
+            print(title)
+            print(f"Response type: {response.msg_type}")
+            print("Response payload:")
+            print(json.dumps(response.payload, indent=2))
+            print()
         
-        print(f"Response type: {response.msg_type}")
-        print(f"Response payload:")
-        print(json.dumps(response.payload, indent=2))
-        print()
-        
-        # Test 3: INSERT
-        print("Test 3: INSERT response...")
-        query_msg = create_query_message("INSERT INTO test_debug VALUES (1, 'hello')")
-        conn._send_message(query_msg)
-        response = conn._receive_message()
-        
-        print(f"Response type: {response.msg_type}")
-        print(f"Response payload:")
-        print(json.dumps(response.payload, indent=2))
-        print()
-        
-        # Test 4: SELECT
-        print("Test 4: SELECT response...")
-        query_msg = create_query_message("SELECT * FROM test_debug")
-        conn._send_message(query_msg)
-        response = conn._receive_message()
-        
-        print(f"Response type: {response.msg_type}")
-        print(f"Response payload:")
-        print(json.dumps(response.payload, indent=2))
-        print()
-        
-        conn.close()
+        await conn.close()
         print("✓ Connection closed")
         
     except Exception as e:
@@ -100,4 +77,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
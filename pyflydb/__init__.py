@@ -42,12 +42,47 @@ Basic Usage:
     conn.commit()
     conn.close()
 
+Socket Tuning:
+    The protocol socket disables Nagle's algorithm, enables TCP keepalive and
+    uses 1 MiB kernel buffers by default. Override with
+    connect(tcp_nodelay=False, keepalive=False, sndbuf=..., rcvbuf=...); pass
+    None for a buffer size to keep the OS default. Other options are applied
+    with socket_options=[(level, optname, value), ...], e.g.
+    [(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60)].
+
 Context Manager Usage:
     with pyflydb.connect(host="localhost", port=8889) as conn:
         with conn.cursor() as cursor:
             cursor.execute("SELECT * FROM users")
             rows = cursor.fetchall()
 
+Transactions:
+    With autocommit disabled (the default), writes can be grouped into an
+    explicit transaction. The server then makes them durable once at commit
+    instead of once per statement, at the cost of holding the transaction
+    open (and its changes invisible to others) until commit:
+    
+    conn.begin()
+    cursor.executemany("INSERT INTO users VALUES (%s, %s)", rows)
+    conn.commit()
+    
+    Independent INSERT/UPDATE/DELETE statements can also be buffered
+    client-side and sent in a single write with conn.chain() / conn.end_chain().
+
+Connection Pool Usage:
+    pool = pyflydb.connect_pool(host="localhost", port=8889, min_size=2, max_size=8)
+    with pool.connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT * FROM users")
+    pool.close()
+
+Asyncio Usage:
+    from pyflydb import aio
+    
+    conn = await aio.connect(host="localhost", port=8889)
+    responses = await asyncio.gather(*(conn.request(msg) for msg in messages))
+    await conn.close()
+
 Features:
     - Full binary protocol support for efficient communication
     - DB-API 2.0 compliant
@@ -59,6 +94,9 @@ Features:
     - Thread-safe connections
 """
 
+import importlib
+from typing import Any, List
+
 __version__ = "1.0.0"
 __author__ = "Firefly Software Solutions Inc."
 __license__ = "Apache-2.0"
@@ -97,14 +135,49 @@ from .exceptions import (
 # Protocol types (for advanced usage)
 from .protocol import MessageType, MessageFlag
 
-# Type adapters and row objects
-from .types import Row, TypeAdapter, DatabaseModel
-
 # Parser
 from .parser import ResultParser
 
-# DSN utilities
-from .dsn import parse_dsn, make_dsn
+# Names imported on first access (PEP 562) so that `import pyflydb` doesn't
+# pay for optional dependencies such as Pydantic until they are used
+_LAZY_IMPORTS = {
+    # Type adapters and row objects
+    "Row": ".types",
+    "TypeAdapter": ".types",
+    "DatabaseModel": ".types",
+    
+    # DSN utilities
+    "parse_dsn": ".dsn",
+    "make_dsn": ".dsn",
+    
+    # Connection pooling
+    "ConnectionPool": ".pool",
+    "connect_pool": ".pool",
+}
+
+
+# Optional submodules loaded on first access, e.g. pyflydb.aio
+_LAZY_SUBMODULES = ("aio",)
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported names on first access."""
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # Later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    """Include lazily exported names in dir()."""
+    return sorted(set(globals()) | set(__all__))
+
 
 # Public API
 __all__ = [
@@ -160,4 +233,11 @@ __all__ = [
     # DSN utilities
     "parse_dsn",
     "make_dsn",
+    
+    # Connection pooling
+    "ConnectionPool",
+    "connect_pool",
+    
+    # Asyncio support
+    "aio",
 ]
@@ -0,0 +1,452 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Asyncio support for pyFlyDb.
+
+This module provides AsyncConnection, an asyncio counterpart of Connection.
+Requests issued concurrently on one AsyncConnection (e.g. with asyncio.gather)
+are pipelined: each is written as soon as it is issued and responses are
+matched to requests in order by a single reader task.
+
+Example:
+    import asyncio
+    from pyflydb import aio
+    
+    async def main():
+        async with await aio.connect(host="localhost", port=8889) as conn:
+            users, orders = conn.cursor(), conn.cursor()
+            await asyncio.gather(
+                users.execute("SELECT * FROM users WHERE age > %s", (30,)),
+                orders.execute("SELECT * FROM orders"),
+            )
+            for row in users:
+                print(row)
+    
+    asyncio.run(main())
+"""
+
+import asyncio
+import socket
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Optional, Sequence, Union
+
+from . import exceptions
+from .connection import (
+    MAX_PIPELINE_DEPTH,
+    RECV_BUFFER_SIZE,
+    STATEMENT_NAME_PREFIX,
+    Connection,
+)
+from .cursor import Cursor
+from .protocol import (
+    Message,
+    MessageType,
+    create_auth_message,
+    create_deallocate_message,
+    create_execute_message,
+    create_ping_message,
+    create_prepare_message,
+    create_query_message,
+)
+
+
+class AsyncConnection:
+    """
+    Asyncio connection to a FlyDB server using the binary protocol.
+    
+    Create instances with pyflydb.aio.connect(). Any number of coroutines
+    may call request() concurrently; at most MAX_PIPELINE_DEPTH requests are
+    in flight at once.
+    """
+    
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        host: str,
+        port: int,
+    ):
+        """
+        Initialize an async connection over an open stream.
+        
+        Args:
+            reader: Stream reader for the server socket
+            writer: Stream writer for the server socket
+            host: Server hostname
+            port: Server port
+        """
+        self.host = host
+        self.port = port
+        
+        self._reader = reader
+        self._writer = writer
+        self._closed = False
+        
+        # Futures for requests awaiting a response, in send order
+        self._pending: Deque[asyncio.Future] = deque()
+        self._slots = asyncio.Semaphore(MAX_PIPELINE_DEPTH)
+        self._read_task = asyncio.ensure_future(self._read_loop())
+        
+        self._stmt_counter = 0
+    
+    async def _read_loop(self) -> None:
+        """Read responses and resolve pending requests in order."""
+        try:
+            buffer = bytearray()
+            while True:
+                data = await self._reader.read(RECV_BUFFER_SIZE)
+                if not data:
+                    raise asyncio.IncompleteReadError(bytes(buffer), None)
+                
+                # Decode every complete response delivered by this read
+                buffer += data
+                messages, consumed = Message.decode_stream(buffer)
+                del buffer[:consumed]
+                
+                for message in messages:
+                    if not self._pending:
+                        raise exceptions.ProtocolError(
+                            f"Unsolicited message from server: {message.msg_type}"
+                        )
+                    
+                    future = self._pending.popleft()
+                    if not future.done():
+                        future.set_result(message)
+        except asyncio.CancelledError:
+            self._fail_pending(exceptions.InterfaceError("Connection is closed"))
+            raise
+        except asyncio.IncompleteReadError:
+            self._fail_pending(
+                exceptions.ConnectionError("Connection lost while reading data")
+            )
+        except exceptions.Error as e:
+            self._fail_pending(e)
+        except Exception as e:
+            self._fail_pending(exceptions.ConnectionError(f"Failed to receive message: {e}"))
+    
+    def _fail_pending(self, error: Exception) -> None:
+        """Fail every pending request with the given error."""
+        self._closed = True
+        while self._pending:
+            future = self._pending.popleft()
+            if not future.done():
+                future.set_exception(error)
+    
+    async def request(self, message: Message) -> Message:
+        """
+        Send a message and wait for its response.
+        
+        Args:
+            message: Message to send
+        
+        Returns:
+            The response message
+        
+        Raises:
+            exceptions.InterfaceError: If connection is closed
+            exceptions.ConnectionError: If the connection fails; a failed
+                send also closes the connection
+        """
+        async with self._slots:
+            if self._closed:
+                raise exceptions.InterfaceError("Connection is closed")
+            
+            future = asyncio.get_running_loop().create_future()
+            
+            # Queue the future and write the request without yielding in
+            # between, so responses are matched in send order
+            self._pending.append(future)
+            self._writer.write(message.to_bytes())
+            
+            try:
+                await self._writer.drain()
+            except OSError as e:
+                # The stream is broken: fail every request waiting on it, so
+                # none waits for a response or is matched to the wrong one
+                error = exceptions.ConnectionError(f"Failed to send message: {e}")
+                future.cancel()
+                self._fail_pending(error)
+                self._read_task.cancel()
+                raise error from e
+            
+            return await future
+    
+    def cursor(self) -> "AsyncCursor":
+        """
+        Create a new cursor.
+        
+        Returns:
+            New AsyncCursor instance
+            
+        Raises:
+            exceptions.InterfaceError: If connection is closed
+        """
+        if self._closed:
+            raise exceptions.InterfaceError("Connection is closed")
+        
+        return AsyncCursor(self)
+    
+    def _next_statement_name(self) -> str:
+        """Return a new prepared statement name."""
+        name = f"{STATEMENT_NAME_PREFIX}{self._stmt_counter}"
+        self._stmt_counter += 1
+        return name
+    
+    async def _authenticate(self, user: str, password: str) -> None:
+        """
+        Authenticate with the FlyDB server.
+        
+        Raises:
+            exceptions.AuthenticationError: If authentication fails
+        """
+        response = await self.request(create_auth_message(user, password))
+        
+        if response.msg_type == MessageType.AUTH_RESULT:
+            if not response.payload.get("success"):
+                raise exceptions.AuthenticationError(
+                    response.payload.get("message", "Authentication failed")
+                )
+        elif response.msg_type == MessageType.ERROR:
+            raise exceptions.AuthenticationError(
+                response.payload.get("message", "Authentication error")
+            )
+        else:
+            raise exceptions.ProtocolError(
+                f"Unexpected response to AUTH: {response.msg_type}"
+            )
+    
+    async def ping(self) -> bool:
+        """
+        Send a ping to check if the connection is alive.
+        
+        Returns:
+            True if server responds, False otherwise
+        """
+        if self._closed:
+            return False
+        
+        try:
+            response = await self.request(create_ping_message())
+            return response.msg_type == MessageType.PONG
+        except Exception:
+            return False
+    
+    async def close(self) -> None:
+        """
+        Close the connection.
+        
+        Requests still waiting for a response fail with InterfaceError.
+        It's safe to call close() multiple times.
+        """
+        if self._writer.is_closing():
+            return
+        
+        self._closed = True
+        self._read_task.cancel()
+        try:
+            await self._read_task
+        except (asyncio.CancelledError, Exception):
+            pass
+        
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except Exception:
+            pass  # Ignore errors during cleanup
+    
+    @property
+    def closed(self) -> bool:
+        """Check if the connection is closed."""
+        return self._closed
+    
+    async def __aenter__(self) -> "AsyncConnection":
+        """Async context manager entry."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit - closes connection."""
+        await self.close()
+
+
+class AsyncCursor(Cursor):
+    """
+    Cursor of an AsyncConnection.
+    
+    execute() and executemany() are coroutines. Results are buffered when
+    they arrive, so fetchone(), fetchmany(), fetchall() and iteration work
+    as on Cursor. Cursors of one connection executing concurrently are
+    pipelined over it.
+    
+    Example:
+        cursor = conn.cursor()
+        await cursor.execute("SELECT * FROM users WHERE id = %s", (1,))
+        row = cursor.fetchone()
+    """
+    
+    async def execute(
+        self,
+        query: str,
+        parameters: Optional[Union[Sequence, Dict[str, Any]]] = None
+    ) -> "AsyncCursor":
+        """
+        Execute a SQL query.
+        
+        Parameters are bound server-side: PREPARE, EXECUTE and DEALLOCATE
+        are pipelined, so the query costs one round trip.
+        
+        Args:
+            query: SQL query string
+            parameters: Optional parameters for query substitution
+                       Can be a sequence for positional parameters (%s)
+                       or dict for named parameters (%(name)s)
+        
+        Returns:
+            Self for method chaining
+            
+        Raises:
+            exceptions.ProgrammingError: If query syntax is invalid
+            exceptions.DatabaseError: If query execution fails
+            exceptions.InterfaceError: If cursor or connection is closed
+        """
+        if self._closed:
+            raise exceptions.InterfaceError("Cursor is closed")
+        
+        connection = self._connection
+        if connection.closed:
+            raise exceptions.InterfaceError("Connection is closed")
+        
+        if parameters:
+            query, values = self._to_server_placeholders(query, parameters)
+        
+        self._last_query = query
+        self._reset_results()
+        
+        if parameters:
+            name = connection._next_statement_name()
+            message = create_execute_message(name, values)
+            prepared, response, _ = await asyncio.gather(
+                connection.request(create_prepare_message(name, query)),
+                connection.request(message),
+                connection.request(create_deallocate_message(name)),
+            )
+            Connection._check_prepare_result(prepared)
+        else:
+            message = create_query_message(query)
+            response = await connection.request(message)
+        
+        self._handle_response(message, response)
+        return self
+    
+    async def executemany(
+        self,
+        query: str,
+        parameters_list: Iterable[Union[Sequence, Dict[str, Any]]]
+    ) -> "AsyncCursor":
+        """
+        Execute a query multiple times with different parameters.
+        
+        Simple ``INSERT ... VALUES (...)`` statements are folded into
+        multi-row INSERTs of up to ``max_batch_rows`` rows each, as with
+        Cursor.executemany().
+        
+        Args:
+            query: SQL query string
+            parameters_list: Iterable of parameter sets
+            
+        Returns:
+            Self for method chaining
+            
+        Raises:
+            exceptions.DatabaseError: If any query execution fails
+        """
+        if self._closed:
+            raise exceptions.InterfaceError("Cursor is closed")
+        
+        # Any iterable is accepted; it is walked more than once below
+        parameters_list = list(parameters_list)
+        
+        batches = self._build_batch_inserts(query, parameters_list)
+        if batches is not None:
+            statements = [(batch_query, None) for batch_query in batches]
+        else:
+            statements = [(query, parameters) for parameters in parameters_list]
+        
+        total_rowcount = 0
+        for statement, parameters in statements:
+            await self.execute(statement, parameters)
+            if self.rowcount >= 0:
+                total_rowcount += self.rowcount
+        
+        self.rowcount = total_rowcount
+        return self
+    
+    def clear_cache(self) -> None:
+        """
+        Do nothing: async connections don't cache prepared statements.
+        
+        Raises:
+            exceptions.InterfaceError: If cursor is closed
+        """
+        if self._closed:
+            raise exceptions.InterfaceError("Cursor is closed")
+
+
+async def connect(
+    host: str = "localhost",
+    port: int = 8889,
+    user: Optional[str] = None,
+    password: Optional[str] = None,
+    connect_timeout: Optional[float] = None,
+) -> AsyncConnection:
+    """
+    Create an asyncio connection to a FlyDB server.
+    
+    Args:
+        host: Hostname or IP address of the FlyDB server
+        port: Port number for the binary protocol (default: 8889)
+        user: Username for authentication
+        password: Password for authentication
+        connect_timeout: Timeout in seconds for connection establishment
+    
+    Returns:
+        A connected AsyncConnection instance
+    
+    Raises:
+        exceptions.ConnectionError: If connection fails
+        exceptions.AuthenticationError: If authentication fails
+    """
+    try:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port), timeout=connect_timeout
+        )
+    except asyncio.TimeoutError as e:
+        raise exceptions.TimeoutError(f"Connection to {host}:{port} timed out") from e
+    except OSError as e:
+        raise exceptions.ConnectionError(f"Failed to connect to {host}:{port}: {e}") from e
+    
+    sock = writer.get_extra_info("socket")
+    if sock is not None:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    
+    conn = AsyncConnection(reader, writer, host, port)
+    
+    if user and password:
+        try:
+            await conn._authenticate(user, password)
+        except Exception:
+            await conn.close()
+            raise
+    
+    return conn
@@ -22,24 +22,38 @@ provides a factory for creating cursors.
 The design is inspired by psycopg3's connection interface.
 """
 
+import copy
+import hashlib
+import re
 import socket
 import threading
-from typing import Any, Dict, Optional, Union
+import time
+from collections import OrderedDict, deque
+from typing import Any, BinaryIO, Deque, Dict, List, Optional, Sequence, Tuple, Union
 from contextlib import contextmanager
 
 from . import exceptions
 from .protocol import (
+    BINARY_CAPABILITY,
     HEADER_SIZE,
+    MSGPACK_AVAILABLE,
+    PAYLOAD_ENCODING_OPTION,
     Message,
     MessageHeader,
     MessageType,
     create_auth_message,
     create_ping_message,
+    create_prepare_message,
+    create_execute_message,
+    create_deallocate_message,
     create_begin_tx_message,
     create_commit_tx_message,
     create_rollback_tx_message,
     create_get_server_info_message,
+    create_set_option_message,
 )
+from .cursor import Cursor
+from .parser import ResultParser
 
 
 # DB-API 2.0 module-level attributes
@@ -47,6 +61,108 @@ apilevel = "2.0"
 threadsafety = 2  # Threads may share the module and connections
 paramstyle = "pyformat"  # Python extended format codes, e.g. ...WHERE name=%(name)s
 
+# Maximum number of pipelined requests awaiting a response. Beyond this the
+# oldest response is drained first so neither side stalls on full socket buffers.
+MAX_PIPELINE_DEPTH = 256
+
+# Default kernel send/receive buffer size for the protocol socket (1 MiB)
+DEFAULT_SOCKET_BUFFER_SIZE = 1 << 20
+
+# TCP keepalive settings: probe after 30s idle, every 10s, give up after 3
+# failed probes; unacknowledged writes fail after TCP_USER_TIMEOUT_MS. Dead
+# peers are thus detected by the kernel within a minute, without ping().
+KEEPALIVE_IDLE = 30
+KEEPALIVE_INTERVAL = 10
+KEEPALIVE_COUNT = 3
+TCP_USER_TIMEOUT_MS = 30_000
+
+# recv() flag making the kernel wait for the full requested length (0 where
+# the platform lacks it)
+MSG_WAITALL = getattr(socket, "MSG_WAITALL", 0)
+
+# Maximum number of buffers handed to a single sendmsg() call (POSIX IOV_MAX
+# is at least 1024 on every supported platform)
+SENDMSG_MAX_BUFFERS = 1024
+
+# Size of the per-connection receive buffer, also used as the buffer size of
+# the socket reader. Larger payloads are read into a one-off buffer so a
+# single big result doesn't pin its memory for good.
+RECV_BUFFER_SIZE = 1 << 16
+
+# Prefix for names of server-side prepared statements created by the driver
+STATEMENT_NAME_PREFIX = "pyflydb_stmt_"
+
+# Statements that don't modify data. A transaction that only ran these is
+# ended without waiting for the server's acknowledgement.
+READ_ONLY_PATTERN = re.compile(
+    r"^\s*(SELECT|SHOW|DESCRIBE|EXPLAIN)\b(?!.*\bINTO\b)", re.IGNORECASE | re.DOTALL
+)
+READ_ONLY_MESSAGES = frozenset({
+    MessageType.PING,
+    MessageType.PREPARE,
+    MessageType.DEALLOCATE,
+    MessageType.GET_SERVER_INFO,
+})
+
+# Payload-less control messages, encoded identically every time, so one
+# instance of each is shared
+_PING_MESSAGE = create_ping_message()
+_COMMIT_MESSAGE = create_commit_tx_message()
+_ROLLBACK_MESSAGE = create_rollback_tx_message()
+_SERVER_INFO_MESSAGE = create_get_server_info_message()
+
+# Seconds a resolved server address is reused before resolving it again
+ADDRESS_CACHE_TTL = 60.0
+
+# Process-wide caches shared by all connections: session tokens issued by the
+# server, keyed by (host, port, user, password digest), server info keyed by
+# (host, port), and resolved addresses keyed by (host, port) with the time
+# they were resolved
+_session_tokens: Dict[Tuple[str, int, str, str], str] = {}
+_server_info_cache: Dict[Tuple[str, int], Dict[str, Any]] = {}
+_address_cache: Dict[Tuple[str, int], Tuple[float, List[Any]]] = {}
+_cache_lock = threading.Lock()
+
+
+def _resolve(host: str, port: int) -> List[Any]:
+    """Resolve a server address, reusing the result for ADDRESS_CACHE_TTL seconds."""
+    key = (host, port)
+    now = time.monotonic()
+    
+    with _cache_lock:
+        cached = _address_cache.get(key)
+    if cached is not None and now - cached[0] < ADDRESS_CACHE_TTL:
+        return cached[1]
+    
+    addresses = [
+        info[4] for info in socket.getaddrinfo(host, port, socket.AF_INET, socket.SOCK_STREAM)
+    ]
+    with _cache_lock:
+        _address_cache[key] = (now, addresses)
+    return addresses
+
+
+def _set_keepalive(sock: socket.socket) -> None:
+    """Enable TCP keepalive, tuning the timers where the platform allows."""
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    
+    for name, value in (
+        ("TCP_KEEPIDLE", KEEPALIVE_IDLE),
+        ("TCP_KEEPINTVL", KEEPALIVE_INTERVAL),
+        ("TCP_KEEPCNT", KEEPALIVE_COUNT),
+        ("TCP_USER_TIMEOUT", TCP_USER_TIMEOUT_MS),
+    ):
+        option = getattr(socket, name, None)
+        if option is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, option, value)
+
+
+def _is_read_only(message: Message) -> bool:
+    """Check whether a request can't modify data."""
+    if message.msg_type == MessageType.QUERY:
+        return READ_ONLY_PATTERN.match(message.payload.get("query", "")) is not None
+    return message.msg_type in READ_ONLY_MESSAGES
+
 
 class Connection:
     """
@@ -79,6 +195,13 @@ class Connection:
         database: Optional[str] = None,
         connect_timeout: Optional[float] = None,
         autocommit: bool = False,
+        statement_cache_size: int = 0,
+        binary_protocol: bool = False,
+        tcp_nodelay: bool = True,
+        keepalive: bool = True,
+        sndbuf: Optional[int] = DEFAULT_SOCKET_BUFFER_SIZE,
+        rcvbuf: Optional[int] = DEFAULT_SOCKET_BUFFER_SIZE,
+        socket_options: Optional[Sequence[Tuple[int, int, Any]]] = None,
     ):
         """
         Initialize a connection to FlyDB.
@@ -91,6 +214,22 @@ class Connection:
             database: Database name (for future multi-database support)
             connect_timeout: Timeout in seconds for connection establishment
             autocommit: Whether to automatically commit transactions
+            statement_cache_size: Maximum number of server-side prepared
+                statements kept per connection. Parameterized queries are
+                prepared once and re-executed with new parameters. With 0,
+                each parameterized query is prepared, executed and
+                deallocated in a single write.
+            binary_protocol: Encode payloads with MessagePack instead of JSON
+                when the server advertises the binary_v2 capability and the
+                msgpack package is installed; otherwise JSON is kept.
+            tcp_nodelay: Disable Nagle's algorithm so small requests are sent
+                immediately instead of waiting for the previous ACK
+            keepalive: Enable TCP keepalive (and, where supported, a TCP user
+                timeout) so the kernel detects dead peers while idle
+            sndbuf: Kernel send buffer size in bytes (None keeps the OS default)
+            rcvbuf: Kernel receive buffer size in bytes (None keeps the OS default)
+            socket_options: Extra (level, optname, value) tuples passed to
+                setsockopt() before connecting, e.g. to enable SO_KEEPALIVE
             
         Raises:
             exceptions.ConnectionError: If connection fails
@@ -103,13 +242,50 @@ class Connection:
         self.database = database
         self.autocommit = autocommit
         self.connect_timeout = connect_timeout
+        self.statement_cache_size = statement_cache_size
+        self.binary_protocol = binary_protocol
+        self.tcp_nodelay = tcp_nodelay
+        self.keepalive = keepalive
+        self.sndbuf = sndbuf
+        self.rcvbuf = rcvbuf
+        self.socket_options = list(socket_options or ())
         
         # Connection state
         self._socket: Optional[socket.socket] = None
+        self._reader: Optional[BinaryIO] = None  # Buffered reads from _socket
         self._closed = False
         self._authenticated = False
         self._in_transaction = False
         self._server_info: Optional[Dict[str, Any]] = None
+        self._binary = False  # Payloads are MessagePack-encoded once negotiated
+        
+        # Reusable receive buffer, filled in place by _recv_exactly()
+        self._rxbuf = bytearray(RECV_BUFFER_SIZE)
+        self._rxview = memoryview(self._rxbuf)
+        
+        # Messages decoded from the read buffer but not yet returned
+        self._received: Deque[Message] = deque()
+        
+        # Pipelining state: handles awaiting a response (in send order) and
+        # responses already drained for handles not yet fetched
+        self._pipeline: Deque[int] = deque()
+        self._pipeline_results: Dict[int, Message] = {}
+        self._next_handle = 0
+        
+        # Prepared statement cache: SQL text -> server statement name, in LRU order
+        self._stmt_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._stmt_counter = 0
+        
+        # Statements buffered between chain() and end_chain()
+        self._chain: Optional[List[Message]] = None
+        
+        # BEGIN waiting to go out with the next request, and transaction
+        # control messages (BEGIN/COMMIT/ROLLBACK) whose acknowledgements are
+        # read before the next response
+        self._pending_begin: Optional[Message] = None
+        self._pending_acks: Deque[str] = deque()
+        self._broken: Optional[Exception] = None  # Failed COMMIT/ROLLBACK sent without waiting
+        self._dirty = False  # Whether the transaction may have modified data
         
         # Thread safety
         self._lock = threading.RLock()
@@ -120,6 +296,10 @@ class Connection:
         # Authenticate if credentials provided
         if user and password:
             self._authenticate()
+        
+        # Switch to binary payloads if requested and supported
+        if binary_protocol:
+            self._negotiate_binary()
     
     def _connect(self) -> None:
         """
@@ -129,36 +309,133 @@ class Connection:
             exceptions.ConnectionError: If connection fails
         """
         try:
-            self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            if self.connect_timeout:
-                self._socket.settimeout(self.connect_timeout)
+            addresses = _resolve(self.host, self.port)
             
-            self._socket.connect((self.host, self.port))
+            # Try each resolved address in turn, keeping the last error
+            for i, address in enumerate(addresses):
+                try:
+                    self._socket = self._open_socket(address)
+                    break
+                except socket.error:
+                    if i == len(addresses) - 1:
+                        raise
             
-            # Set socket to blocking mode after connection
-            self._socket.settimeout(None)
+            # Buffer reads so one recv() can return several small messages;
+            # writes still go straight to the socket
+            self._reader = self._socket.makefile("rb", buffering=RECV_BUFFER_SIZE)
             
         except socket.timeout as e:
+            self._forget_address()
             raise exceptions.TimeoutError(
                 f"Connection to {self.host}:{self.port} timed out"
             ) from e
         except socket.error as e:
+            self._forget_address()
             raise exceptions.ConnectionError(
                 f"Failed to connect to {self.host}:{self.port}: {e}"
             ) from e
     
+    def _open_socket(self, address: Any) -> socket.socket:
+        """
+        Create a configured socket and connect it to one server address.
+        
+        Args:
+            address: Resolved socket address
+            
+        Returns:
+            The connected socket, in blocking mode
+            
+        Raises:
+            socket.error: If connecting fails
+        """
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            if self.connect_timeout:
+                sock.settimeout(self.connect_timeout)
+            
+            # Buffer sizes must be set before connecting to affect window scaling
+            if self.sndbuf:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.sndbuf)
+            if self.rcvbuf:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.rcvbuf)
+            if self.tcp_nodelay:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if self.keepalive:
+                _set_keepalive(sock)
+            for level, optname, value in self.socket_options:
+                sock.setsockopt(level, optname, value)
+            
+            sock.connect(address)
+            
+            # Set socket to blocking mode after connection
+            sock.settimeout(None)
+            return sock
+        except BaseException:
+            sock.close()
+            raise
+    
+    def _forget_address(self) -> None:
+        """Drop the cached address after a failed connect so it is resolved again."""
+        with _cache_lock:
+            _address_cache.pop((self.host, self.port), None)
+    
     def _authenticate(self) -> None:
         """
         Authenticate with the FlyDB server.
         
+        The credentials are sent in a single AUTH message and verified by the
+        server; the driver does no client-side hashing, so authentication
+        costs one round trip and no local CPU work.
+        
+        If the server returned a session token for the same credentials
+        earlier in this process, the token is presented instead so the server
+        can skip password verification. The password is only sent if the
+        token is rejected.
+        
         Raises:
             exceptions.AuthenticationError: If authentication fails
         """
         if not self.user or not self.password:
             return
         
-        # Create and send authentication message
-        auth_msg = create_auth_message(self.user, self.password)
+        key = (
+            self.host,
+            self.port,
+            self.user,
+            hashlib.sha256(self.password.encode("utf-8")).hexdigest(),
+        )
+        with _cache_lock:
+            token = _session_tokens.get(key)
+        
+        if token is not None:
+            try:
+                payload = self._auth_request(create_auth_message(self.user, token=token))
+            except exceptions.AuthenticationError:
+                # Expired or revoked token: forget it and use the password
+                with _cache_lock:
+                    _session_tokens.pop(key, None)
+            else:
+                self._authenticated = True
+                self._store_session_token(key, payload)
+                return
+        
+        payload = self._auth_request(create_auth_message(self.user, self.password))
+        self._authenticated = True
+        self._store_session_token(key, payload)
+    
+    def _auth_request(self, auth_msg: Message) -> Dict[str, Any]:
+        """
+        Send an AUTH message and check the response.
+        
+        Args:
+            auth_msg: Authentication message to send
+            
+        Returns:
+            Payload of the successful AUTH_RESULT
+            
+        Raises:
+            exceptions.AuthenticationError: If authentication fails
+        """
         self._send_message(auth_msg)
         
         # Receive authentication response
@@ -167,11 +444,10 @@ class Connection:
         if response.msg_type == MessageType.AUTH_RESULT:
             payload = response.payload
             if payload.get("success"):
-                self._authenticated = True
-            else:
-                raise exceptions.AuthenticationError(
-                    payload.get("message", "Authentication failed")
-                )
+                return payload
+            raise exceptions.AuthenticationError(
+                payload.get("message", "Authentication failed")
+            )
         elif response.msg_type == MessageType.ERROR:
             raise exceptions.AuthenticationError(
                 response.payload.get("message", "Authentication error")
@@ -181,92 +457,557 @@ class Connection:
                 f"Unexpected response to AUTH: {response.msg_type}"
             )
     
-    def _send_message(self, message: Message) -> None:
+    @staticmethod
+    def _store_session_token(key: Tuple[str, int, str, str], payload: Dict[str, Any]) -> None:
+        """Remember the session token from an AUTH_RESULT payload, if any."""
+        token = payload.get("session_token")
+        if token:
+            with _cache_lock:
+                _session_tokens[key] = token
+    
+    def _negotiate_binary(self) -> None:
+        """
+        Switch payload encoding to MessagePack if both sides support it.
+        
+        The server must list BINARY_CAPABILITY in its capabilities and accept
+        the payload encoding session option. Otherwise JSON is kept.
+        """
+        if not MSGPACK_AVAILABLE:
+            return
+        
+        info = self.get_server_info()
+        if BINARY_CAPABILITY not in (info.get("capabilities") or []):
+            return
+        
+        self._send_message(create_set_option_message(PAYLOAD_ENCODING_OPTION, "msgpack"))
+        response = self._receive_message()
+        
+        if response.msg_type == MessageType.SESSION_RESULT:
+            self._binary = bool(response.payload.get("success", True))
+    
+    def _send_message(self, message: Message, pipelined: bool = False) -> None:
         """
         Send a message to the server.
         
         Args:
             message: Message to send
+            pipelined: Whether the response will be collected via fetch().
+                Synchronous sends first drain any outstanding pipelined
+                responses so the next response read belongs to this message.
+            
+        Raises:
+            exceptions.ConnectionError: If sending fails
+            exceptions.InterfaceError: If connection is closed
+        """
+        self._send_messages((message,), pipelined)
+    
+    def _send_messages(self, messages: Sequence[Message], pipelined: bool = False) -> None:
+        """
+        Send several messages to the server in a single write.
+        
+        Args:
+            messages: Messages to send, in order
+            pipelined: Whether the responses will be collected via fetch()
             
         Raises:
             exceptions.ConnectionError: If sending fails
             exceptions.InterfaceError: If connection is closed
         """
         with self._lock:
-            if self._closed:
-                raise exceptions.InterfaceError("Connection is closed")
+            if self.closed or self._socket is None:
+                self._raise_unusable()
+            
+            if not pipelined:
+                while self._pipeline:
+                    self._drain_pipeline()
             
-            if not self._socket:
-                raise exceptions.InterfaceError("Not connected")
+            if self._in_transaction and not self._dirty:
+                self._dirty = not all(_is_read_only(message) for message in messages)
+            
+            if self._pending_begin is not None:
+                begin, self._pending_begin = self._pending_begin, None
+                if all(_is_read_only(message) for message in messages):
+                    # Send the deferred BEGIN in the same write as the first
+                    # statement; a read is harmless if the BEGIN fails
+                    messages = [begin, *messages]
+                    self._pending_acks.append("BEGIN")
+                else:
+                    # A write sent along with a failing BEGIN would run
+                    # outside any transaction and autocommit, so wait for
+                    # the BEGIN to succeed first
+                    self._write_messages([begin])
+                    self._check_tx_result(self._receive_message(), "BEGIN")
+            
+            self._write_messages(messages)
+    
+    def _write_messages(self, messages: Sequence[Message]) -> None:
+        """
+        Write encoded messages to the socket.
+        
+        Args:
+            messages: Messages to write, in order
+            
+        Raises:
+            exceptions.ConnectionError: If sending fails
+            exceptions.InterfaceError: If connection is closed
+        """
+        with self._lock:
+            if self.closed or self._socket is None:
+                self._raise_unusable()
             
             try:
-                data = message.to_bytes()
-                self._socket.sendall(data)
+                buffers = []
+                for message in messages:
+                    buffers.extend(message.to_buffers(self._binary))
+                
+                if hasattr(self._socket, "sendmsg"):
+                    self._sendmsg_all(buffers)
+                else:
+                    self._socket.sendall(b"".join(buffers))
             except socket.error as e:
                 self._closed = True
                 raise exceptions.ConnectionError(f"Failed to send message: {e}") from e
     
+    def _sendmsg_all(self, buffers: List[bytes]) -> None:
+        """
+        Write all buffers with scatter-gather sendmsg() calls.
+        
+        Args:
+            buffers: Buffers to send, in order
+            
+        Raises:
+            socket.error: If sending fails
+        """
+        views = [memoryview(buffer) for buffer in buffers if buffer]
+        first = 0
+        
+        while first < len(views):
+            sent = self._socket.sendmsg(views[first:first + SENDMSG_MAX_BUFFERS])
+            
+            # Skip fully sent buffers and trim a partially sent one
+            while first < len(views) and sent >= len(views[first]):
+                sent -= len(views[first])
+                first += 1
+            if sent:
+                views[first] = views[first][sent:]
+    
     def _receive_message(self) -> Message:
         """
         Receive a message from the server.
         
+        Acknowledgements of transaction control messages sent without
+        waiting (a deferred BEGIN, or the COMMIT/ROLLBACK ending a read-only
+        transaction) are read and checked first.
+        
+        A failed COMMIT or ROLLBACK is not reported as a failure of this
+        request, which has already run: the message is returned and the
+        connection refuses further requests, see _read_pending_acks().
+        
         Returns:
             Received message
             
         Raises:
             exceptions.ConnectionError: If receiving fails
             exceptions.ProtocolError: If message format is invalid
+            exceptions.TransactionError: If a deferred BEGIN failed
         """
         with self._lock:
-            if self._closed:
-                raise exceptions.InterfaceError("Connection is closed")
+            if self._closed or self._socket is None:
+                self._raise_unusable()
             
-            if not self._socket:
-                raise exceptions.InterfaceError("Not connected")
+            if not self._pending_acks:
+                return self._read_message()
             
+            # Read the response even if an acknowledgement reports an error,
+            # so the connection stays in sync
+            error: Optional[Exception] = None
             try:
-                # Read header
-                header_data = self._recv_exactly(HEADER_SIZE)
-                header = MessageHeader.from_bytes(header_data)
-                
-                # Read payload
-                payload_data = b""
-                if header.length > 0:
-                    payload_data = self._recv_exactly(header.length)
-                
-                # Decode message
-                message = Message.from_bytes(header, payload_data)
-                return message
-                
-            except socket.error as e:
-                self._closed = True
-                raise exceptions.ConnectionError(f"Failed to receive message: {e}") from e
+                self._read_pending_acks()
+            except exceptions.TransactionError as e:
+                error = e
+            
+            message = self._read_message()
+            if error is not None:
+                raise error
+            return message
+    
+    def _read_pending_acks(self) -> None:
+        """
+        Read and check the acknowledgements of transaction control messages
+        that were sent without waiting for the server.
+        
+        Every acknowledgement is read before raising, so the connection
+        stays in sync. A failed BEGIN is raised: the request it went out with
+        belongs to that transaction. A failed COMMIT or ROLLBACK is not, as
+        the caller already ended the transaction and may have run unrelated
+        statements since. It is kept in _broken instead, and as the server's
+        transaction state is unknown the connection then counts as closed:
+        responses already in flight can still be read, but the next request
+        closes it and raises InterfaceError.
+        If an acknowledgement can't be read at all, the stream is out of sync
+        and the connection is marked closed.
+        
+        Raises:
+            exceptions.TransactionError: If a deferred BEGIN failed
+            exceptions.ConnectionError: If receiving fails
+            exceptions.ProtocolError: If an acknowledgement is invalid
+        """
+        with self._lock:
+            error: Optional[Exception] = None
+            while self._pending_acks:
+                action = self._pending_acks.popleft()
+                try:
+                    self._check_tx_result(self._read_message(), action)
+                except exceptions.TransactionError as e:
+                    if action == "BEGIN":
+                        error = error or e
+                    else:
+                        self._broken = self._broken or e
+                except Exception:
+                    self._pending_acks.clear()
+                    self._closed = True
+                    raise
+            
+            if error is not None:
+                raise error
+    
+    def _raise_unusable(self) -> None:
+        """
+        Raise the error for a closed or not yet connected connection.
+        
+        Raises:
+            exceptions.InterfaceError: Always
+        """
+        if self._broken is not None:
+            # Release the socket; the server ends the transaction it left open
+            self.close()
+            raise exceptions.InterfaceError(
+                f"Connection is closed: {self._broken}"
+            ) from self._broken
+        if self._closed:
+            raise exceptions.InterfaceError("Connection is closed")
+        raise exceptions.InterfaceError("Not connected")
+    
+    def _read_message(self) -> Message:
+        """
+        Read and decode one message from the socket.
+        
+        Every complete message already in the read buffer is decoded at
+        once and the rest are returned by the following calls, so a burst of
+        small responses (pipelined or chained requests) costs one recv().
+        Messages that don't fit in the buffer are read in header and payload
+        steps.
+        
+        Must be called with the connection lock held.
+        
+        Returns:
+            Received message
+            
+        Raises:
+            exceptions.ConnectionError: If receiving fails
+            exceptions.ProtocolError: If message format is invalid
+        """
+        if self._received:
+            return self._received.popleft()
+        
+        try:
+            messages, consumed = Message.decode_stream(self._reader.peek(), self._binary)
+            if messages:
+                # Drop the decoded bytes from the reader
+                self._reader.readinto(self._rxview[:consumed])
+                self._received.extend(messages[1:])
+                return messages[0]
+            
+            # Read header
+            header_data = self._recv_exactly(HEADER_SIZE)
+            header = MessageHeader.from_bytes(header_data)
+            
+            # Read payload (overwrites the header bytes, already decoded)
+            payload_data = b""
+            if header.length > 0:
+                payload_data = self._recv_exactly(header.length)
+            
+            # Decode message before the receive buffer is reused
+            message = Message.from_bytes(header, payload_data, self._binary)
+            return message
+            
+        except socket.error as e:
+            self._closed = True
+            raise exceptions.ConnectionError(f"Failed to receive message: {e}") from e
+    
+    def _prepare(self, query: str) -> str:
+        """
+        Get the name of a server-side prepared statement for a query.
+        
+        Statements are cached by SQL text, ignoring surrounding whitespace and
+        a trailing semicolon. On a miss the query is prepared on the server;
+        when the cache is full the least recently used statement is
+        deallocated.
+        
+        Args:
+            query: SQL query with server-side placeholders ($1, $2, ...)
+            
+        Returns:
+            Name of the prepared statement
+            
+        Raises:
+            exceptions.ProgrammingError: If the server rejects the statement
+        """
+        query = query.strip().rstrip(";").rstrip()
+        
+        with self._lock:
+            name = self._stmt_cache.get(query)
+            if name is not None:
+                self._stmt_cache.move_to_end(query)
+                return name
+            
+            name = self._prepare_statement(query)
+            self._stmt_cache[query] = name
+            
+            while len(self._stmt_cache) > self.statement_cache_size:
+                _, evicted = self._stmt_cache.popitem(last=False)
+                self._deallocate(evicted)
+            
+            return name
+    
+    def _prepare_statement(self, query: str) -> str:
+        """
+        Prepare a query on the server under a new statement name.
+        
+        The statement is not cached; release it with _deallocate().
+        
+        Args:
+            query: SQL query with server-side placeholders ($1, $2, ...)
+            
+        Returns:
+            Name of the prepared statement
+            
+        Raises:
+            exceptions.ProgrammingError: If the server rejects the statement
+        """
+        with self._lock:
+            name = self._next_statement_name()
+            self._send_message(create_prepare_message(name, query))
+            response = self._receive_message()
+        
+        self._check_prepare_result(response)
+        return name
+    
+    def _execute_once(self, query: str, values: List[Any]) -> Tuple[Message, Message]:
+        """
+        Execute a query with server-side parameters, without caching it.
+        
+        PREPARE, EXECUTE and DEALLOCATE are sent in a single write, so the
+        query costs one round trip.
+        
+        Args:
+            query: SQL query with server-side placeholders ($1, $2, ...)
+            values: Parameter values in placeholder order
+            
+        Returns:
+            Tuple of (EXECUTE message, its response)
+            
+        Raises:
+            exceptions.ProgrammingError: If the server rejects the statement
+        """
+        with self._lock:
+            name = self._next_statement_name()
+            message = create_execute_message(name, values)
+            
+            self._send_messages((
+                create_prepare_message(name, query),
+                message,
+                create_deallocate_message(name),
+            ))
+            
+            # Read all three responses before raising, so the connection
+            # stays in sync
+            prepared = self._receive_message()
+            response = self._receive_message()
+            self._receive_message()
+        
+        self._check_prepare_result(prepared)
+        return message, response
+    
+    def _next_statement_name(self) -> str:
+        """Return a new prepared statement name. Call with the lock held."""
+        name = f"{STATEMENT_NAME_PREFIX}{self._stmt_counter}"
+        self._stmt_counter += 1
+        return name
+    
+    @staticmethod
+    def _check_prepare_result(response: Message) -> None:
+        """
+        Check the server's response to a PREPARE message.
+        
+        Raises:
+            exceptions.ProgrammingError: If the server rejected the statement
+            exceptions.ProtocolError: If the response type is unexpected
+        """
+        if response.msg_type == MessageType.PREPARE_RESULT:
+            if not response.payload.get("success", True):
+                raise exceptions.ProgrammingError(
+                    response.payload.get("message", "Prepare failed")
+                )
+        elif response.msg_type == MessageType.ERROR:
+            raise exceptions.ProgrammingError(
+                response.payload.get("message", "Prepare error"),
+                code=response.payload.get("code", 0),
+            )
+        else:
+            raise exceptions.ProtocolError(
+                f"Unexpected response to PREPARE: {response.msg_type}"
+            )
+    
+    def _clear_statement_cache(self) -> None:
+        """
+        Deallocate all cached prepared statements.
+        
+        The DEALLOCATE messages are sent in a single write. Errors are
+        ignored, since the server may already have dropped statements that
+        referenced altered objects.
+        """
+        with self._lock:
+            if not self._stmt_cache:
+                return
+            
+            names = list(self._stmt_cache.values())
+            self._stmt_cache.clear()
+            
+            if self._closed:
+                return
+            
+            self._send_messages([create_deallocate_message(name) for name in names])
+            for _ in names:
+                self._receive_message()
+    
+    def _deallocate(self, name: str) -> None:
+        """
+        Release a server-side prepared statement.
+        
+        Args:
+            name: Name of the prepared statement
+        """
+        self._send_message(create_deallocate_message(name))
+        response = self._receive_message()
+        
+        if response.msg_type == MessageType.ERROR:
+            raise exceptions.DatabaseError(
+                response.payload.get("message", "Deallocate error")
+            )
+    
+    def send_async(self, message: Message) -> int:
+        """
+        Send a message without waiting for its response.
+        
+        Several requests can be in flight at once; responses arrive in send
+        order and are collected with fetch(). At most MAX_PIPELINE_DEPTH
+        requests are kept outstanding - beyond that the oldest response is
+        read and buffered before sending.
+        
+        Args:
+            message: Message to send
+            
+        Returns:
+            Handle to pass to fetch() to obtain the response
+            
+        Raises:
+            exceptions.ConnectionError: If sending fails
+            exceptions.InterfaceError: If connection is closed
+            
+        Example:
+            handles = [conn.send_async(create_query_message(q)) for q in queries]
+            responses = [conn.fetch(h) for h in handles]
+        """
+        with self._lock:
+            while len(self._pipeline) >= MAX_PIPELINE_DEPTH:
+                self._drain_pipeline()
+            
+            self._send_message(message, pipelined=True)
+            
+            handle = self._next_handle
+            self._next_handle += 1
+            self._pipeline.append(handle)
+            return handle
     
-    def _recv_exactly(self, n: int) -> bytes:
+    def fetch(self, handle: int) -> Message:
+        """
+        Collect the response to a request sent with send_async().
+        
+        Args:
+            handle: Handle returned by send_async()
+            
+        Returns:
+            The response message
+            
+        Raises:
+            exceptions.InterfaceError: If the handle is unknown or already fetched
+            exceptions.ConnectionError: If receiving fails
+        """
+        with self._lock:
+            while handle not in self._pipeline_results:
+                if handle not in self._pipeline:
+                    raise exceptions.InterfaceError(f"Unknown pipeline handle: {handle}")
+                self._drain_pipeline()
+            
+            return self._pipeline_results.pop(handle)
+    
+    def _drain_pipeline(self) -> None:
+        """Read the response to the oldest outstanding pipelined request."""
+        handle = self._pipeline[0]
+        self._pipeline_results[handle] = self._receive_message()
+        self._pipeline.popleft()
+    
+    def _recv_exactly(self, n: int) -> memoryview:
         """
         Receive exactly n bytes from the socket.
         
+        Data is copied from the buffered socket reader into the connection's
+        receive buffer, so the returned view is only valid until the next call.
+        Payloads larger than that buffer are read with MSG_WAITALL where
+        available, so the kernel returns them in a single recv() call.
+        
         Args:
             n: Number of bytes to receive
             
         Returns:
-            Received bytes
+            View of the received bytes
             
         Raises:
             exceptions.ConnectionError: If connection is lost
         """
-        data = b""
-        while len(data) < n:
-            chunk = self._socket.recv(n - len(data))
-            if not chunk:
+        received = 0
+        if n <= RECV_BUFFER_SIZE:
+            view = self._rxview[:n]
+            read = self._reader.readinto
+        else:
+            view = memoryview(bytearray(n))
+            read = self._reader.readinto
+            if MSG_WAITALL:
+                # Take what the reader has buffered, then have the kernel
+                # deliver the rest in one call
+                received = self._reader.readinto1(view)
+                read = self._recv_waitall
+        
+        while received < n:
+            count = read(view[received:])
+            if not count:
                 raise exceptions.ConnectionError("Connection lost while reading data")
-            data += chunk
-        return data
+            received += count
+        return view
+    
+    def _recv_waitall(self, view: memoryview) -> int:
+        """Receive into view straight from the socket with MSG_WAITALL."""
+        return self._socket.recv_into(view, len(view), MSG_WAITALL)
     
-    def cursor(self) -> "Cursor":
+    def cursor(self, name: Optional[str] = None) -> "Cursor":
         """
         Create a new cursor for executing queries.
         
+        Args:
+            name: Create a named cursor that streams results from a
+                server-side cursor instead of loading them all at once
+        
         Returns:
             A new Cursor instance
             
@@ -277,61 +1018,217 @@ class Connection:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM users")
             rows = cursor.fetchall()
+            
+            with conn.cursor(name="big_scan") as cursor:
+                cursor.execute("SELECT * FROM events")
+                for row in cursor:
+                    process(row)
         """
         if self._closed:
             raise exceptions.InterfaceError("Connection is closed")
         
-        # Import here to avoid circular dependency
-        from .cursor import Cursor
-        return Cursor(self)
+        return Cursor(self, name)
     
-    def commit(self) -> None:
+    def begin(
+        self, isolation_level: int = 1, read_only: bool = False, deferrable: bool = False
+    ) -> None:
         """
-        Commit the current transaction.
+        Start an explicit transaction.
+        
+        Grouping many writes into one transaction means the server makes them
+        durable once at commit() instead of once per statement.
         
-        If autocommit is enabled, this is a no-op.
+        BEGIN is deferred until the next request. If that request only reads,
+        BEGIN goes out in the same write and its acknowledgement is checked
+        together with the response, saving a round trip. Otherwise BEGIN is
+        sent first and must succeed before the request is sent, so a write
+        never runs outside the transaction. Either way a failed BEGIN is
+        reported by the next call that talks to the server, and the
+        connection is left with no transaction active.
         
+        Args:
+            isolation_level: Transaction isolation level
+            read_only: Whether the transaction is read-only
+            deferrable: Whether the transaction is deferrable
+            
         Raises:
-            exceptions.TransactionError: If commit fails
+            exceptions.TransactionError: If a transaction is already active
             exceptions.InterfaceError: If connection is closed
         """
         if self._closed:
             raise exceptions.InterfaceError("Connection is closed")
         
-        if self.autocommit:
-            return
-        
-        if not self._in_transaction:
-            return
+        if self._in_transaction:
+            raise exceptions.TransactionError("Transaction already active")
         
-        # Send commit message
-        commit_msg = create_commit_tx_message()
-        self._send_message(commit_msg)
+        with self._lock:
+            # Outstanding pipelined responses must not be taken for the
+            # BEGIN acknowledgement
+            while self._pipeline:
+                self._drain_pipeline()
+            
+            self._pending_begin = create_begin_tx_message(
+                isolation_level, read_only, deferrable
+            )
+            self._in_transaction = True
+            self._dirty = False
+    
+    def _check_tx_result(self, response: Message, action: str) -> None:
+        """
+        Check the response to a BEGIN, COMMIT or ROLLBACK.
         
-        # Receive response
-        response = self._receive_message()
+        Args:
+            response: Response message
+            action: "BEGIN", "COMMIT" or "ROLLBACK"
         
+        Raises:
+            exceptions.TransactionError: If the server reports a failure
+        """
         if response.msg_type == MessageType.TX_RESULT:
             if response.payload.get("success"):
+                return
+            if action == "BEGIN":
                 self._in_transaction = False
-            else:
-                raise exceptions.TransactionError(
-                    response.payload.get("message", "Commit failed")
-                )
+            raise exceptions.TransactionError(
+                response.payload.get("message", f"{action.capitalize()} failed")
+            )
         elif response.msg_type == MessageType.ERROR:
+            if action == "BEGIN":
+                self._in_transaction = False
             raise exceptions.TransactionError(
-                response.payload.get("message", "Commit error")
+                response.payload.get("message", f"{action.capitalize()} error")
             )
         else:
             raise exceptions.ProtocolError(
-                f"Unexpected response to COMMIT: {response.msg_type}"
+                f"Unexpected response to {action}: {response.msg_type}"
             )
     
+    def _end_transaction(self, message: Message, action: str) -> None:
+        """
+        Send COMMIT or ROLLBACK and wait for the result if data may have changed.
+        
+        Args:
+            message: COMMIT or ROLLBACK message
+            action: "COMMIT" or "ROLLBACK"
+        
+        Raises:
+            exceptions.TransactionError: If the server reports a failure
+        """
+        with self._lock:
+            if self._pending_begin is not None:
+                # Nothing was sent since begin(), so there is nothing to end
+                self._pending_begin = None
+                self._in_transaction = False
+                return
+            
+            dirty = self._dirty
+            self._send_message(message)
+            
+            if not dirty:
+                # Only reads since begin(): the result can't lose any work, so
+                # it is checked along with the next response instead
+                self._pending_acks.append(action)
+                self._in_transaction = False
+                return
+            
+            response = self._receive_message()
+            self._check_tx_result(response, action)
+            self._in_transaction = False
+    
+    def chain(self) -> None:
+        """
+        Start buffering INSERT/UPDATE/DELETE statements client-side.
+        
+        Until end_chain() is called, cursors on this connection queue data
+        modification statements instead of sending them; end_chain() then
+        sends the whole chain in one write. Other statements raise
+        ProgrammingError while a chain is open.
+        
+        Raises:
+            exceptions.InterfaceError: If connection is closed or a chain is already open
+        """
+        if self._closed:
+            raise exceptions.InterfaceError("Connection is closed")
+        
+        if self._chain is not None:
+            raise exceptions.InterfaceError("Statement chain already open")
+        
+        self._chain = []
+    
+    def end_chain(self) -> int:
+        """
+        Send all statements buffered since chain() and collect their results.
+        
+        Returns:
+            Total number of rows affected by the chained statements
+            
+        Raises:
+            exceptions.InterfaceError: If no chain is open
+            exceptions.DatabaseError: If any chained statement failed. All
+                responses are read before raising, so the connection stays usable.
+        """
+        if self._chain is None:
+            raise exceptions.InterfaceError("No statement chain open")
+        
+        messages, self._chain = self._chain, None
+        if not messages:
+            return 0
+        
+        with self._lock:
+            self._send_messages(messages)
+            responses = [self._receive_message() for _ in messages]
+        
+        total_rowcount = 0
+        for response in responses:
+            if response.msg_type == MessageType.ERROR:
+                raise exceptions.DatabaseError(
+                    response.payload.get("message", "Query execution failed"),
+                    code=response.payload.get("code", 0),
+                )
+            if response.msg_type != MessageType.QUERY_RESULT:
+                raise exceptions.ProtocolError(
+                    f"Unexpected response to chained statement: {response.msg_type}"
+                )
+            if not response.payload.get("success", False):
+                raise exceptions.QueryError(response.payload.get("message", "Query failed"))
+            
+            parsed = ResultParser.parse_result(response.payload.get("message", ""))
+            total_rowcount += parsed.get("row_count") or response.payload.get("row_count", 0)
+        
+        return total_rowcount
+    
+    def commit(self) -> None:
+        """
+        Commit the current transaction.
+        
+        If autocommit is enabled, this is a no-op. If the transaction only
+        ran read-only statements, the COMMIT is sent without waiting for the
+        server. It can't be skipped, as the transaction is open on the
+        server. If it fails, the response to the next request is still
+        returned, and the connection is closed after it: later requests raise
+        InterfaceError naming the failure.
+        
+        Raises:
+            exceptions.TransactionError: If commit fails
+            exceptions.InterfaceError: If connection is closed
+        """
+        if self._closed:
+            raise exceptions.InterfaceError("Connection is closed")
+        
+        if self.autocommit:
+            return
+        
+        if not self._in_transaction:
+            return
+        
+        self._end_transaction(_COMMIT_MESSAGE, "COMMIT")
+    
     def rollback(self) -> None:
         """
         Rollback the current transaction.
         
-        If autocommit is enabled, this is a no-op.
+        If autocommit is enabled, this is a no-op. As with commit(), a
+        read-only transaction is rolled back without waiting for the server.
         
         Raises:
             exceptions.TransactionError: If rollback fails
@@ -346,28 +1243,7 @@ class Connection:
         if not self._in_transaction:
             return
         
-        # Send rollback message
-        rollback_msg = create_rollback_tx_message()
-        self._send_message(rollback_msg)
-        
-        # Receive response
-        response = self._receive_message()
-        
-        if response.msg_type == MessageType.TX_RESULT:
-            if response.payload.get("success"):
-                self._in_transaction = False
-            else:
-                raise exceptions.TransactionError(
-                    response.payload.get("message", "Rollback failed")
-                )
-        elif response.msg_type == MessageType.ERROR:
-            raise exceptions.TransactionError(
-                response.payload.get("message", "Rollback error")
-            )
-        else:
-            raise exceptions.ProtocolError(
-                f"Unexpected response to ROLLBACK: {response.msg_type}"
-            )
+        self._end_transaction(_ROLLBACK_MESSAGE, "ROLLBACK")
     
     def ping(self) -> bool:
         """
@@ -380,8 +1256,7 @@ class Connection:
             return False
         
         try:
-            ping_msg = create_ping_message()
-            self._send_message(ping_msg)
+            self._send_message(_PING_MESSAGE)
             response = self._receive_message()
             return response.msg_type == MessageType.PONG
         except Exception:
@@ -391,6 +1266,11 @@ class Connection:
         """
         Get information about the FlyDB server.
         
+        The result is cached per server (host and port) for the lifetime of
+        the process, so only the first connection pays the round trip. Each
+        call returns a copy, so callers may modify it without affecting the
+        cache.
+        
         Returns:
             Dictionary with server information including version, capabilities, etc.
             
@@ -400,19 +1280,24 @@ class Connection:
         if self._closed:
             raise exceptions.InterfaceError("Connection is closed")
         
-        # Return cached info if available
+        # Use cached info if available, from this or an earlier connection to
+        # the same server
+        if not self._server_info:
+            with _cache_lock:
+                self._server_info = _server_info_cache.get((self.host, self.port))
         if self._server_info:
-            return self._server_info
+            return copy.deepcopy(self._server_info)
         
         # Request server info
-        info_msg = create_get_server_info_message()
-        self._send_message(info_msg)
+        self._send_message(_SERVER_INFO_MESSAGE)
         
         response = self._receive_message()
         
         if response.msg_type == MessageType.SESSION_RESULT:
             self._server_info = response.payload
-            return self._server_info
+            with _cache_lock:
+                _server_info_cache[(self.host, self.port)] = self._server_info
+            return copy.deepcopy(self._server_info)
         elif response.msg_type == MessageType.ERROR:
             raise exceptions.DatabaseError(
                 response.payload.get("message", "Failed to get server info")
@@ -436,6 +1321,13 @@ class Connection:
                 return
             
             self._closed = True
+            self._pipeline.clear()
+            self._pipeline_results.clear()
+            self._stmt_cache.clear()
+            self._chain = None
+            self._pending_begin = None
+            self._pending_acks.clear()
+            self._received.clear()
             
             # Rollback any active transaction
             if self._in_transaction:
@@ -444,7 +1336,15 @@ class Connection:
                 except Exception:
                     pass  # Ignore errors during cleanup
             
-            # Close the socket
+            # Close the socket (the reader holds a reference to it)
+            if self._reader:
+                try:
+                    self._reader.close()
+                except Exception:
+                    pass  # Ignore errors during cleanup
+                finally:
+                    self._reader = None
+            
             if self._socket:
                 try:
                     self._socket.close()
@@ -455,8 +1355,8 @@ class Connection:
     
     @property
     def closed(self) -> bool:
-        """Check if the connection is closed."""
-        return self._closed
+        """Check if the connection is closed or can no longer be used."""
+        return self._closed or self._broken is not None
     
     def __enter__(self) -> "Connection":
         """Context manager entry."""
@@ -481,11 +1381,19 @@ class Connection:
         self.close()
     
     def __del__(self) -> None:
-        """Destructor - ensure connection is closed."""
-        try:
-            self.close()
-        except Exception:
-            pass
+        """Destructor - release the socket without talking to the server."""
+        # No lock and no rollback: the lock may be held by a thread that is
+        # gone, and the server discards the session and any open transaction
+        # when the socket closes
+        self._closed = True
+        for name in ("_reader", "_socket"):
+            resource = getattr(self, name, None)
+            if resource is not None:
+                setattr(self, name, None)
+                try:
+                    resource.close()
+                except Exception:
+                    pass
 
 
 def connect(
@@ -497,6 +1405,13 @@ def connect(
     database: Optional[str] = None,
     connect_timeout: Optional[float] = None,
     autocommit: bool = False,
+    statement_cache_size: int = 0,
+    binary_protocol: bool = False,
+    tcp_nodelay: bool = True,
+    keepalive: bool = True,
+    sndbuf: Optional[int] = DEFAULT_SOCKET_BUFFER_SIZE,
+    rcvbuf: Optional[int] = DEFAULT_SOCKET_BUFFER_SIZE,
+    socket_options: Optional[Sequence[Tuple[int, int, Any]]] = None,
     **kwargs
 ) -> Connection:
     """
@@ -513,6 +1428,14 @@ def connect(
         database: Database name (reserved for future use)
         connect_timeout: Timeout in seconds for connection establishment
         autocommit: Whether to automatically commit transactions
+        statement_cache_size: Number of prepared statements cached per
+            connection (0 disables server-side preparation)
+        binary_protocol: Negotiate MessagePack payloads if the server supports them
+        tcp_nodelay: Disable Nagle's algorithm on the protocol socket
+        keepalive: Let the kernel detect dead peers with TCP keepalive
+        sndbuf: Kernel send buffer size in bytes (None keeps the OS default)
+        rcvbuf: Kernel receive buffer size in bytes (None keeps the OS default)
+        socket_options: Extra (level, optname, value) tuples passed to setsockopt()
         **kwargs: Additional connection parameters
         
     Returns:
@@ -557,6 +1480,20 @@ def connect(
         if connect_timeout is not None:
             params["connect_timeout"] = connect_timeout
         params["autocommit"] = autocommit
+        if statement_cache_size:
+            params["statement_cache_size"] = statement_cache_size
+        if binary_protocol:
+            params["binary_protocol"] = binary_protocol
+        if not tcp_nodelay:
+            params["tcp_nodelay"] = tcp_nodelay
+        if not keepalive:
+            params["keepalive"] = keepalive
+        if sndbuf != DEFAULT_SOCKET_BUFFER_SIZE:
+            params["sndbuf"] = sndbuf
+        if rcvbuf != DEFAULT_SOCKET_BUFFER_SIZE:
+            params["rcvbuf"] = rcvbuf
+        if socket_options is not None:
+            params["socket_options"] = socket_options
         params.update(kwargs)
         return Connection(**params)
     
@@ -568,4 +1505,11 @@ def connect(
         database=database,
         connect_timeout=connect_timeout,
         autocommit=autocommit,
+        statement_cache_size=statement_cache_size,
+        binary_protocol=binary_protocol,
+        tcp_nodelay=tcp_nodelay,
+        keepalive=keepalive,
+        sndbuf=sndbuf,
+        rcvbuf=rcvbuf,
+        socket_options=socket_options,
     )
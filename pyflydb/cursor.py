@@ -19,19 +19,230 @@ This module provides the Cursor class for executing SQL queries and fetching res
 The design follows the Python DB-API 2.0 specification and is inspired by psycopg3.
 """
 
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+import re
+import sys
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 from . import exceptions
 from .protocol import (
+    Message,
     MessageType,
     create_query_message,
     create_prepare_message,
     create_execute_message,
     create_deallocate_message,
+    create_cursor_open_message,
+    create_cursor_fetch_message,
+    create_cursor_close_message,
 )
 from .parser import ResultParser
 
 
+# Matches "INSERT INTO ... VALUES (...)" so executemany() can fold a batch of
+# parameter sets into a single multi-row INSERT statement.
+INSERT_VALUES_PATTERN = re.compile(
+    r"^\s*(INSERT\s+INTO\s+.+?\s+VALUES\s*)(\(.*\))\s*;?\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Default maximum number of rows folded into one multi-row INSERT
+DEFAULT_MAX_BATCH_ROWS = 1000
+
+# Default number of rows a named (server-side) cursor fetches per round trip
+DEFAULT_ITERSIZE = 2000
+
+# pyformat placeholders (%(name)s, %s) and escaped percent signs (%%), compiled
+# once so parameter substitution is a single scan of the query
+PLACEHOLDER_PATTERN = re.compile(r"%\(([^)]+)\)s|%s|%%")
+
+# Data modification statements that may be buffered in a statement chain
+DML_PATTERN = re.compile(r"^\s*(INSERT|UPDATE|DELETE)\b", re.IGNORECASE)
+
+# Schema changes, after which cached prepared statements may be stale
+DDL_PATTERN = re.compile(r"^\s*(CREATE|DROP|ALTER|TRUNCATE)\b", re.IGNORECASE)
+
+
+def _is_single_row(values: str) -> bool:
+    """
+    Check that a VALUES clause is exactly one parenthesised row.
+    
+    The closing parenthesis matching the opening one must be the last
+    character, so multi-row templates ("(1), (%s)") and trailing clauses
+    ("(%s) RETURNING (a)") are not folded. Parentheses inside quoted
+    literals are ignored.
+    
+    Args:
+        values: Text captured after VALUES, starting with "("
+        
+    Returns:
+        True if the text is a single balanced row
+    """
+    depth = 0
+    quote = None
+    for index, char in enumerate(values):
+        if quote is not None:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth == 0:
+                return index == len(values) - 1
+    return False
+
+
+def _quote(value: str) -> str:
+    """Quote a string literal, escaping single quotes by doubling them."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _escape_other(value: Any) -> str:
+    """Escape a value whose exact type has no entry in _ESCAPERS."""
+    if value is None:
+        return "NULL"
+    elif isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    elif isinstance(value, (int, float)):
+        return str(value)
+    elif isinstance(value, str):
+        return _quote(value)
+    else:
+        # For other types, convert to string and escape
+        return _quote(str(value))
+
+
+# SQL literal renderers by exact type, so escaping a value of a common type is
+# one dict lookup; subclasses and other types go through _escape_other()
+_ESCAPERS: Dict[type, Callable[[Any], str]] = {
+    type(None): lambda value: "NULL",
+    bool: lambda value: "TRUE" if value else "FALSE",
+    int: str,
+    float: str,
+    str: _quote,
+}
+
+
+@lru_cache(maxsize=256)
+def _description(columns: Tuple[str, ...]) -> Tuple[Tuple[Any, ...], ...]:
+    """
+    Build the DB-API description for a set of column names.
+    
+    Cached per column list; the result is immutable, so repeated queries
+    returning the same columns share one description.
+    
+    Args:
+        columns: Column names
+        
+    Returns:
+        One 7-item tuple per column
+    """
+    return tuple((name, None, None, None, None, None, None) for name in columns)
+
+
+@lru_cache(maxsize=256)
+def _compile_server_query(
+    query: str, named: bool
+) -> Tuple[str, Tuple[Union[int, str], ...]]:
+    """
+    Rewrite pyformat placeholders to server-side $N placeholders.
+    
+    The result depends only on the query text, so it is computed once per
+    distinct query and reused for every execution.
+    
+    Args:
+        query: SQL query with %s or %(name)s placeholders
+        named: Whether the query is used with named (dict) parameters
+        
+    Returns:
+        Tuple of (rewritten query, parameter index or name for each $N)
+        
+    Raises:
+        exceptions.ProgrammingError: If the query mixes placeholder styles
+    """
+    keys: List[Union[int, str]] = []
+    slots: Dict[Union[int, str], str] = {}
+    
+    def replace(match: "re.Match[str]") -> str:
+        if match.group(0) == "%%":
+            return "%"
+        
+        name = match.group(1)
+        if (name is not None) != named:
+            if named:
+                raise exceptions.ProgrammingError(
+                    "Positional placeholder %s used with named parameters"
+                )
+            raise exceptions.ProgrammingError(
+                f"Named placeholder %({name})s used with positional parameters"
+            )
+        
+        key: Union[int, str] = name if named else len(keys)
+        if key not in slots:
+            keys.append(key)
+            slots[key] = f"${len(keys)}"
+        return slots[key]
+    
+    return PLACEHOLDER_PATTERN.sub(replace, query), tuple(keys)
+
+
+@lru_cache(maxsize=256)
+def _compile_client_query(
+    query: str, named: bool
+) -> Tuple[Tuple[str, ...], Tuple[Union[int, str], ...]]:
+    """
+    Split a query into the literal text around its pyformat placeholders.
+    
+    The result depends only on the query text, so client-side substitution
+    scans each distinct query once and then only joins escaped values
+    between the cached segments.
+    
+    Args:
+        query: SQL query with %s or %(name)s placeholders
+        named: Whether the query is used with named (dict) parameters
+        
+    Returns:
+        Tuple of (literal segments with %% unescaped, parameter index or name
+        for each placeholder); there is one more segment than placeholders
+        
+    Raises:
+        exceptions.ProgrammingError: If the query mixes placeholder styles
+    """
+    segments: List[str] = []
+    keys: List[Union[int, str]] = []
+    literal: List[str] = []
+    last = 0
+    
+    for match in PLACEHOLDER_PATTERN.finditer(query):
+        literal.append(query[last:match.start()])
+        last = match.end()
+        
+        if match.group(0) == "%%":
+            literal.append("%")
+            continue
+        
+        name = match.group(1)
+        if (name is not None) != named:
+            if named:
+                raise exceptions.ProgrammingError(
+                    "Positional placeholder %s used with named parameters"
+                )
+            raise exceptions.ProgrammingError(
+                f"Named placeholder %({name})s used with positional parameters"
+            )
+        
+        segments.append("".join(literal))
+        literal = []
+        keys.append(name if named else len(keys))
+    
+    literal.append(query[last:])
+    segments.append("".join(literal))
+    return tuple(segments), tuple(keys)
+
+
 class Cursor:
     """
     Database cursor for executing queries and fetching results.
@@ -45,33 +256,54 @@ class Cursor:
             row = cursor.fetchone()
             print(row)
     
+    A named cursor (conn.cursor(name="...")) keeps the result set on the
+    server and holds at most ``itersize`` rows client-side, fetching the next
+    chunk when they are consumed. Use it for results too large to load at
+    once; rowcount is -1 until all rows have been fetched.
+    
     DB-API 2.0 Attributes:
         description: Column metadata (name, type, etc.)
         rowcount: Number of rows affected/returned
         arraysize: Default number of rows for fetchmany()
+    
+    Attributes:
+        max_batch_rows: Maximum rows per multi-row INSERT sent by executemany()
+        name: Server-side cursor name, or None for a client-side cursor
+        itersize: Rows fetched per round trip by a named cursor
     """
     
-    def __init__(self, connection: "Connection"):
+    def __init__(self, connection: "Connection", name: Optional[str] = None):
         """
         Initialize a cursor.
         
         Args:
             connection: The Connection instance that owns this cursor
+            name: Name of a server-side cursor to stream results through
         """
         self._connection = connection
         self._closed = False
+        self.name = name
+        self.itersize: int = DEFAULT_ITERSIZE
         
         # DB-API 2.0 attributes
-        self.description: Optional[List[Tuple]] = None
+        self.description: Optional[Sequence[Tuple]] = None
         self.rowcount: int = -1
         self.arraysize: int = 1
         
+        # Batching
+        self.max_batch_rows: int = DEFAULT_MAX_BATCH_ROWS
+        
         # Query results
-        self._rows: List[List[Any]] = []
+        self._rows: List[Tuple[Any, ...]] = []
         self._row_index: int = 0
         
+        # Open server-side cursor of a named cursor
+        self._cursor_id: Optional[str] = None
+        self._has_more = False
+        
         # Last query information
         self._last_query: Optional[str] = None
+        self._query_message: Optional[Message] = None
         self._columns: List[str] = []
     
     def execute(
@@ -112,21 +344,78 @@ class Cursor:
         if self._connection.closed:
             raise exceptions.InterfaceError("Connection is closed")
         
-        # Handle parameter substitution
-        if parameters:
-            query = self._substitute_parameters(query, parameters)
+        if self.name is not None:
+            return self._open_server_cursor(query, parameters)
         
-        self._last_query = query
-        self._reset_results()
+        chain = self._connection._chain
+        if chain is not None and not DML_PATTERN.match(query):
+            raise exceptions.ProgrammingError(
+                "Only INSERT, UPDATE and DELETE statements can be chained"
+            )
+        
+        cached = self._connection.statement_cache_size > 0
+        
+        if parameters and chain is None and not cached:
+            # Bind parameters server-side with a one-off prepared statement
+            query, values = self._to_server_placeholders(query, parameters)
+            self._last_query = query
+            self._reset_results()
+            
+            message, response = self._connection._execute_once(query, values)
+            self._handle_response(message, response)
+            return self
+        
+        if parameters and cached:
+            # Prepare once per distinct query, then send only the parameters
+            query, values = self._to_server_placeholders(query, parameters)
+            self._last_query = query
+            self._reset_results()
+            
+            statement = self._connection._prepare(query)
+            message = create_execute_message(statement, values)
+        else:
+            # Chained statements need a single message each, so without a
+            # statement cache their parameters are substituted client-side
+            if parameters:
+                query = self._substitute_parameters(query, parameters)
+            
+            self._last_query = query
+            self._reset_results()
+            
+            # Re-executing the same SQL reuses the already encoded message
+            message = self._query_message
+            if message is None or message.payload["query"] != query:
+                message = create_query_message(query)
+                self._query_message = message
+        
+        # Buffer data modifications while a statement chain is open
+        if chain is not None:
+            chain.append(message)
+            return self
         
         # Send query message
-        query_msg = create_query_message(query)
-        self._connection._send_message(query_msg)
+        self._connection._send_message(message)
         
         # Receive response
-        response = self._connection._receive_message()
+        self._handle_response(message, self._connection._receive_message())
+        
+        if self._connection._stmt_cache and DDL_PATTERN.match(query):
+            self._connection._clear_statement_cache()
+        
+        return self
+    
+    def _handle_response(self, message: "Message", response: "Message") -> None:
+        """
+        Handle the server's response to a QUERY or EXECUTE message.
         
-        # Handle response
+        Args:
+            message: The message that was sent
+            response: The response received for it
+            
+        Raises:
+            exceptions.DatabaseError: If the server reported an error
+            exceptions.ProtocolError: If the response type is unexpected
+        """
         if response.msg_type == MessageType.QUERY_RESULT:
             self._handle_query_result(response.payload)
         elif response.msg_type == MessageType.ERROR:
@@ -135,22 +424,116 @@ class Cursor:
             raise exceptions.DatabaseError(error_msg, code=error_code)
         else:
             raise exceptions.ProtocolError(
-                f"Unexpected response to QUERY: {response.msg_type}"
+                f"Unexpected response to {message.msg_type.name}: {response.msg_type}"
             )
+    
+    def _open_server_cursor(
+        self,
+        query: str,
+        parameters: Optional[Union[Sequence, Dict[str, Any]]]
+    ) -> "Cursor":
+        """
+        Execute a query through a server-side cursor and fetch the first chunk.
+        
+        Args:
+            query: SQL query string
+            parameters: Optional parameters, bound server-side
+            
+        Returns:
+            Self for method chaining
+        """
+        self._close_server_cursor()
+        
+        values = None
+        if parameters:
+            query, values = self._to_server_placeholders(query, parameters)
         
+        self._last_query = query
+        self._reset_results()
+        
+        message = create_cursor_open_message(self.name, query, values, self.itersize)
+        self._connection._send_message(message)
+        response = self._connection._receive_message()
+        
+        self._handle_cursor_result(message, response)
+        self._cursor_id = response.payload.get("cursor_id", self.name)
         return self
     
+    def _fetch_chunk(self) -> bool:
+        """
+        Replace the buffered rows with the next chunk from the server cursor.
+        
+        Returns:
+            True if rows were fetched, False if the result set is exhausted
+        """
+        while self._has_more:
+            message = create_cursor_fetch_message(self._cursor_id, self.itersize)
+            self._connection._send_message(message)
+            self._handle_cursor_result(message, self._connection._receive_message())
+            if self._rows:
+                return True
+        return False
+    
+    def _handle_cursor_result(self, message: Message, response: Message) -> None:
+        """
+        Handle the server's response to a CURSOR_OPEN or CURSOR_FETCH message.
+        
+        Args:
+            message: The message that was sent
+            response: The response received for it
+            
+        Raises:
+            exceptions.DatabaseError: If the server reported an error
+            exceptions.ProtocolError: If the response type is unexpected
+        """
+        if response.msg_type == MessageType.ERROR:
+            self._has_more = False
+            raise exceptions.DatabaseError(
+                response.payload.get("message", "Query execution failed"),
+                code=response.payload.get("code", 0),
+            )
+        if response.msg_type != MessageType.CURSOR_RESULT:
+            raise exceptions.ProtocolError(
+                f"Unexpected response to {message.msg_type.name}: {response.msg_type}"
+            )
+        
+        payload = response.payload
+        columns = payload.get("columns")
+        if columns:
+            self._columns = [sys.intern(name) for name in columns]
+            self.description = _description(tuple(self._columns))
+        
+        self._rows = [tuple(row) for row in payload.get("rows") or ()]
+        self._row_index = 0
+        self._has_more = bool(payload.get("has_more"))
+        
+        # The total is only known once the last chunk has arrived
+        if not self._has_more:
+            self.rowcount = payload.get("row_count", -1)
+    
+    def _close_server_cursor(self) -> None:
+        """Close the open server-side cursor, if any."""
+        cursor_id, self._cursor_id = self._cursor_id, None
+        self._has_more = False
+        
+        if cursor_id is None or self._connection.closed:
+            return
+        
+        # A cursor the server already closed reports an error; ignore it
+        self._connection._send_message(create_cursor_close_message(cursor_id))
+        self._connection._receive_message()
+    
     def executemany(
         self,
         query: str,
-        parameters_list: Sequence[Union[Sequence, Dict[str, Any]]]
+        parameters_list: Iterable[Union[Sequence, Dict[str, Any]]]
     ) -> "Cursor":
         """
         Execute a query multiple times with different parameters.
         
         Args:
             query: SQL query string
-            parameters_list: Sequence of parameter sets
+            parameters_list: Iterable of parameter sets
             
         Returns:
             Self for method chaining
@@ -158,6 +541,16 @@ class Cursor:
         Raises:
             exceptions.DatabaseError: If any query execution fails
             
+        Note:
+            Simple ``INSERT ... VALUES (...)`` statements are folded into
+            multi-row INSERTs of up to ``max_batch_rows`` rows each, so a
+            batch costs one round trip per chunk instead of one per row.
+            Other statements are prepared once on the server and executed
+            with each parameter set, so the SQL text is sent and parsed once;
+            the executions are pipelined in chunks of ``max_batch_rows``. If
+            one of them fails, others in the same chunk may already have been
+            applied - run the batch in a transaction to make it atomic.
+            
         Example:
             cursor.executemany(
                 "INSERT INTO users (name, age) VALUES (%s, %s)",
@@ -167,16 +560,125 @@ class Cursor:
         if self._closed:
             raise exceptions.InterfaceError("Cursor is closed")
         
+        # Any iterable is accepted; it is walked more than once below
+        parameters_list = list(parameters_list)
         total_rowcount = 0
         
-        for parameters in parameters_list:
-            self.execute(query, parameters)
-            if self.rowcount >= 0:
-                total_rowcount += self.rowcount
+        batches = self._build_batch_inserts(query, parameters_list)
+        if batches is not None:
+            for batch_query in batches:
+                self.execute(batch_query)
+                if self.rowcount >= 0:
+                    total_rowcount += self.rowcount
+        elif len(parameters_list) > 1 and self._connection._chain is None:
+            total_rowcount = self._execute_prepared_many(query, parameters_list)
+        else:
+            for parameters in parameters_list:
+                self.execute(query, parameters)
+                if self.rowcount >= 0:
+                    total_rowcount += self.rowcount
         
         self.rowcount = total_rowcount
         return self
     
+    def _execute_prepared_many(
+        self,
+        query: str,
+        parameters_list: Sequence[Union[Sequence, Dict[str, Any]]]
+    ) -> int:
+        """
+        Prepare a query once and execute it with each parameter set.
+        
+        The statement comes from the connection's statement cache if it is
+        enabled; otherwise it is prepared for this batch only and deallocated
+        afterwards. EXECUTE messages are sent in chunks of up to
+        ``max_batch_rows``, one write and one round trip per chunk.
+        
+        Args:
+            query: SQL query string
+            parameters_list: Sequence of parameter sets
+            
+        Returns:
+            Total number of rows affected
+        """
+        if self._connection.closed:
+            raise exceptions.InterfaceError("Connection is closed")
+        
+        # Bind every parameter set up front so a bad one fails the whole
+        # batch before anything is sent to the server
+        bound = [self._to_server_placeholders(query, p) for p in parameters_list]
+        query = bound[0][0]
+        self._last_query = query
+        
+        connection = self._connection
+        total_rowcount = 0
+        
+        with connection._lock:
+            cached = connection.statement_cache_size > 0
+            if cached:
+                statement = connection._prepare(query)
+            else:
+                statement = connection._prepare_statement(query)
+            
+            try:
+                chunk_size = max(1, self.max_batch_rows)
+                for start in range(0, len(bound), chunk_size):
+                    messages = [
+                        create_execute_message(statement, values)
+                        for _, values in bound[start:start + chunk_size]
+                    ]
+                    
+                    # Send the chunk in one write and read every response
+                    # before raising, so the connection stays in sync
+                    connection._send_messages(messages)
+                    responses = [connection._receive_message() for _ in messages]
+                    
+                    for message, response in zip(messages, responses):
+                        self._reset_results()
+                        self._handle_response(message, response)
+                        if self.rowcount >= 0:
+                            total_rowcount += self.rowcount
+            finally:
+                if not cached and not connection.closed:
+                    connection._deallocate(statement)
+        
+        return total_rowcount
+    
+    def _build_batch_inserts(
+        self,
+        query: str,
+        parameters_list: Sequence[Union[Sequence, Dict[str, Any]]]
+    ) -> Optional[Iterator[str]]:
+        """
+        Fold an INSERT template and its parameter sets into multi-row INSERTs.
+        
+        Args:
+            query: SQL query string
+            parameters_list: Sequence of parameter sets
+            
+        Returns:
+            Iterator of multi-row INSERT statements, each covering at most
+            ``max_batch_rows`` parameter sets, or None if the query cannot be
+            batched and must be executed once per parameter set
+        """
+        match = INSERT_VALUES_PATTERN.match(query)
+        if not match or not parameters_list:
+            return None
+        
+        prefix, values = match.groups()
+        if not _is_single_row(values):
+            return None
+        
+        # Render every row up front so a bad parameter set fails the whole
+        # batch before anything is sent to the server
+        rendered = [self._substitute_parameters(values, p) for p in parameters_list]
+        chunk_size = max(1, self.max_batch_rows)
+        
+        return (
+            prefix + ", ".join(rendered[i:i + chunk_size])
+            for i in range(0, len(rendered), chunk_size)
+        )
+    
     def fetchone(self) -> Optional[Tuple[Any, ...]]:
         """
         Fetch the next row from the result set.
@@ -197,12 +699,12 @@ class Cursor:
         if self._closed:
             raise exceptions.InterfaceError("Cursor is closed")
         
-        if self._row_index >= len(self._rows):
+        if self._row_index >= len(self._rows) and not self._fetch_chunk():
             return None
         
         row = self._rows[self._row_index]
         self._row_index += 1
-        return tuple(row)
+        return row
     
     def fetchmany(self, size: Optional[int] = None) -> List[Tuple[Any, ...]]:
         """
@@ -232,12 +734,16 @@ class Cursor:
         if size is None:
             size = self.arraysize
         
-        rows = []
-        for _ in range(size):
-            row = self.fetchone()
-            if row is None:
-                break
-            rows.append(row)
+        start = self._row_index
+        end = min(start + max(size, 0), len(self._rows))
+        self._row_index = end
+        rows = self._rows[start:end]
+        
+        # Named cursors refill the buffer from the server as it runs out
+        while len(rows) < size and self._fetch_chunk():
+            end = min(size - len(rows), len(self._rows))
+            self._row_index = end
+            rows += self._rows[:end]
         
         return rows
     
@@ -260,15 +766,133 @@ class Cursor:
         if self._closed:
             raise exceptions.InterfaceError("Cursor is closed")
         
-        rows = []
-        while True:
-            row = self.fetchone()
-            if row is None:
-                break
-            rows.append(row)
+        rows = self._rows[self._row_index:]
+        self._row_index = len(self._rows)
+        
+        while self._fetch_chunk():
+            rows += self._rows
+            self._row_index = len(self._rows)
         
         return rows
     
+    def fetch_numpy(self) -> Dict[str, Any]:
+        """
+        Fetch all remaining rows as one NumPy array per column.
+        
+        Columns holding only integers become int64 arrays, only booleans
+        bool arrays, and only numbers float64 arrays. Anything else,
+        including columns with NULLs, becomes an object array.
+        
+        Returns:
+            Dictionary mapping column names to numpy.ndarray
+            
+        Raises:
+            exceptions.InterfaceError: If cursor is closed
+            ImportError: If NumPy is not installed
+            
+        Example:
+            cursor.execute("SELECT id, age FROM users")
+            columns = cursor.fetch_numpy()
+            mean_age = columns["column_1"].mean()
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError(
+                "NumPy is required for fetch_numpy(). Install with: pip install numpy"
+            ) from None
+        
+        names, columns = self._fetch_columns()
+        return {
+            name: np.array(values, dtype=_numpy_dtype(values))
+            for name, values in zip(names, columns)
+        }
+    
+    def fetch_arrow(self) -> Any:
+        """
+        Fetch all remaining rows as a pyarrow.Table.
+        
+        Column types are inferred by pyarrow. The table can be handed to
+        pandas with table.to_pandas().
+        
+        Returns:
+            pyarrow.Table with one column per result column
+            
+        Raises:
+            exceptions.InterfaceError: If cursor is closed
+            ImportError: If pyarrow is not installed
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError(
+                "pyarrow is required for fetch_arrow(). Install with: pip install pyarrow"
+            ) from None
+        
+        names, columns = self._fetch_columns()
+        return pa.table({name: list(values) for name, values in zip(names, columns)})
+    
+    def _fetch_columns(self) -> Tuple[List[str], List[Tuple[Any, ...]]]:
+        """
+        Fetch all remaining rows transposed into columns.
+        
+        Returns:
+            Tuple of (column names, one tuple of values per column)
+        """
+        rows = self.fetchall()
+        
+        names = list(self._columns)
+        if not names and rows:
+            names = [f"column_{i}" for i in range(len(rows[0]))]
+        
+        columns = list(zip(*rows)) if rows else [()] * len(names)
+        return names, columns
+    
+    def mogrify(
+        self,
+        query: str,
+        parameters: Optional[Union[Sequence, Dict[str, Any]]] = None
+    ) -> str:
+        """
+        Return a query with its parameters substituted as SQL literals.
+        
+        execute() binds parameters server-side; this renders the equivalent
+        SQL text, e.g. for logging and debugging.
+        
+        Args:
+            query: SQL query string
+            parameters: Optional parameters for query substitution
+            
+        Returns:
+            The query with parameters substituted
+            
+        Raises:
+            exceptions.ProgrammingError: If parameters don't match placeholders
+            
+        Example:
+            cursor.mogrify("SELECT * FROM users WHERE name = %s", ("O'Brien",))
+            # "SELECT * FROM users WHERE name = 'O''Brien'"
+        """
+        if not parameters:
+            return query
+        return self._substitute_parameters(query, parameters)
+    
+    def clear_cache(self) -> None:
+        """
+        Deallocate the connection's cached prepared statements.
+        
+        The cache is cleared automatically after CREATE, DROP, ALTER and
+        TRUNCATE statements run through a cursor; call this after schema
+        changes made by other clients.
+        
+        Raises:
+            exceptions.InterfaceError: If cursor is closed
+        """
+        if self._closed:
+            raise exceptions.InterfaceError("Cursor is closed")
+        
+        self._connection._clear_statement_cache()
+    
     def close(self) -> None:
         """
         Close the cursor and release resources.
@@ -279,8 +903,12 @@ class Cursor:
         if self._closed:
             return
         
-        self._closed = True
-        self._reset_results()
+        try:
+            self._close_server_cursor()
+        finally:
+            self._closed = True
+            self._reset_results()
+            self._query_message = None
     
     def _reset_results(self) -> None:
         """Reset result state for a new query."""
@@ -303,29 +931,34 @@ class Cursor:
             error_msg = payload.get("message", "Query failed")
             raise exceptions.QueryError(error_msg)
         
-        # Parse the result message using enhanced parser
-        message = payload.get("message", "")
-        parsed = ResultParser.parse_result(message, success)
+        if "rows" in payload and "columns" in payload:
+            # Structured result: nothing to parse
+            columns = payload.get("columns") or []
+            rows = payload["rows"] or []
+            rowcount = payload.get("row_count", len(rows))
+        else:
+            # Parse the result message using enhanced parser
+            parsed = ResultParser.parse_result(payload.get("message", ""), success)
+            columns = parsed.get("columns") or payload.get("columns") or []
+            rows = parsed.get("rows") or []
+            rowcount = parsed.get("row_count") or payload.get("row_count", len(rows))
         
-        # Extract columns from parsed result or original payload
-        self._columns = parsed.get("columns") or payload.get("columns") or []
+        # Intern column names: they repeat across results, and the interned
+        # strings make the description cache lookup an identity comparison
+        self._columns = [sys.intern(name) for name in columns]
         
         # Build description tuple (DB-API 2.0)
         # Set to None for non-SELECT queries (no columns)
         if self._columns:
-            self.description = [
-                (name, None, None, None, None, None, None)
-                for name in self._columns
-            ]
+            self.description = _description(tuple(self._columns))
         else:
             self.description = None
         
-        # Extract rows from parsed result or original payload
-        rows = parsed.get("rows") or payload.get("rows")
-        self._rows = rows if rows else []
-        
-        # Set rowcount from parsed result or original payload
-        self.rowcount = parsed.get("row_count") or payload.get("row_count", len(self._rows))
+        # Convert rows to tuples once here so fetching rows doesn't copy them
+        if rows and not isinstance(rows[0], tuple):
+            rows = [tuple(row) for row in rows]
+        self._rows = rows
+        self.rowcount = rowcount
         
         # Reset row index
         self._row_index = 0
@@ -338,6 +971,10 @@ class Cursor:
         """
         Substitute parameters into the query string.
         
+        The query is split around its placeholders once per distinct query;
+        each call only escapes the values and joins them with the cached
+        literal segments.
+        
         Args:
             query: SQL query with placeholders
             parameters: Parameters to substitute
@@ -345,33 +982,81 @@ class Cursor:
         Returns:
             Query with parameters substituted
             
-        Note:
-            This is a simple implementation. In production, you'd want
-            proper SQL escaping and parameterized queries.
+        Raises:
+            exceptions.ProgrammingError: If parameters don't match placeholders
         """
-        if isinstance(parameters, dict):
-            # Named parameters: %(name)s
-            return query % {k: self._escape_value(v) for k, v in parameters.items()}
-        else:
-            # Positional parameters: %s
-            # Convert to tuple if it's a list
-            if isinstance(parameters, list):
-                parameters = tuple(parameters)
-            
-            # Simple substitution - replace %s with values
-            parts = query.split("%s")
-            if len(parts) - 1 != len(parameters):
-                raise exceptions.ProgrammingError(
-                    f"Query requires {len(parts) - 1} parameters, but {len(parameters)} provided"
-                )
+        named = isinstance(parameters, dict)
+        segments, keys = _compile_client_query(query, named)
+        
+        if named:
+            for key in keys:
+                if key not in parameters:
+                    raise exceptions.ProgrammingError(f"Missing parameter: {key}")
+        elif len(keys) > len(parameters):
+            raise exceptions.ProgrammingError(
+                f"Query requires more than {len(parameters)} parameters"
+            )
+        elif len(keys) < len(parameters):
+            raise exceptions.ProgrammingError(
+                f"Query requires {len(keys)} parameters, but {len(parameters)} provided"
+            )
+        
+        escape = self._escape_value
+        parts = [segments[0]]
+        for key, segment in zip(keys, segments[1:]):
+            parts.append(escape(parameters[key]))
+            parts.append(segment)
+        return "".join(parts)
+    
+    def _to_server_placeholders(
+        self,
+        query: str,
+        parameters: Union[Sequence, Dict[str, Any]]
+    ) -> Tuple[str, List[Any]]:
+        """
+        Rewrite pyformat placeholders to server-side $N placeholders.
+        
+        Named parameters used more than once share a single placeholder. The
+        rewrite is cached per query, so repeated executions only bind values.
+        
+        Args:
+            query: SQL query with %s or %(name)s placeholders
+            parameters: Parameters for the placeholders
+            
+        Returns:
+            Tuple of (rewritten query, parameter values in placeholder order)
             
-            result = []
-            for i, part in enumerate(parts[:-1]):
-                result.append(part)
-                result.append(self._escape_value(parameters[i]))
-            result.append(parts[-1])
+        Raises:
+            exceptions.ProgrammingError: If parameters don't match placeholders
+        """
+        named = isinstance(parameters, dict)
+        query, keys = _compile_server_query(query, named)
+        
+        if named:
+            for key in keys:
+                if key not in parameters:
+                    raise exceptions.ProgrammingError(f"Missing parameter: {key}")
+        elif len(keys) != len(parameters):
+            raise exceptions.ProgrammingError(
+                f"Query requires {len(keys)} parameters, but {len(parameters)} provided"
+            )
+        
+        bind_value = self._bind_value
+        return query, [bind_value(parameters[key]) for key in keys]
+    
+    def _bind_value(self, value: Any) -> Any:
+        """
+        Convert a parameter to a value that can be sent to the server.
+        
+        Args:
+            value: Parameter value
             
-            return "".join(result)
+        Returns:
+            The value itself for JSON-native types, otherwise its string form
+        """
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        return str(value)
     
     def _escape_value(self, value: Any) -> str:
         """
@@ -383,20 +1068,10 @@ class Cursor:
         Returns:
             Escaped string representation
         """
-        if value is None:
-            return "NULL"
-        elif isinstance(value, bool):
-            return "TRUE" if value else "FALSE"
-        elif isinstance(value, (int, float)):
-            return str(value)
-        elif isinstance(value, str):
-            # Escape single quotes by doubling them
-            escaped = value.replace("'", "''")
-            return f"'{escaped}'"
-        else:
-            # For other types, convert to string and escape
-            escaped = str(value).replace("'", "''")
-            return f"'{escaped}'"
+        escape = _ESCAPERS.get(type(value))
+        if escape is not None:
+            return escape(value)
+        return _escape_other(value)
     
     @property
     def closed(self) -> bool:
@@ -411,9 +1086,28 @@ class Cursor:
         """Context manager exit - closes cursor."""
         self.close()
     
-    def __iter__(self) -> "Cursor":
-        """Make cursor iterable."""
-        return self
+    def __iter__(self) -> Iterator[Tuple[Any, ...]]:
+        """
+        Iterate over the remaining rows.
+        
+        Rows are yielded straight from the result buffer rather than through
+        a fetch call per row; the position is kept up to date, so fetch
+        methods continue where iteration stopped.
+        
+        Raises:
+            exceptions.InterfaceError: If cursor is closed
+        """
+        if self._closed:
+            raise exceptions.InterfaceError("Cursor is closed")
+        
+        while True:
+            rows = self._rows
+            for index in range(self._row_index, len(rows)):
+                self._row_index = index + 1
+                yield rows[index]
+            
+            if not self._fetch_chunk():
+                return
     
     def __next__(self) -> Tuple[Any, ...]:
         """Iterator next - fetch next row."""
@@ -421,3 +1115,23 @@ class Cursor:
         if row is None:
             raise StopIteration
         return row
+
+
+def _numpy_dtype(values: Sequence[Any]) -> str:
+    """
+    Pick the NumPy dtype for a column of values.
+    
+    Args:
+        values: Column values
+        
+    Returns:
+        "bool", "int64", "float64" or "object"
+    """
+    types = set(map(type, values))
+    if types == {bool}:
+        return "bool"
+    if types == {int}:
+        return "int64"
+    if types <= {int, float}:
+        return "float64"
+    return "object"
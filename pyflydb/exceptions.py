@@ -36,8 +36,12 @@ class Error(Exception):
     Base class for all database errors.
     
     This is the root of the exception hierarchy for database-related errors.
+    Errors are raised often on some paths (e.g. per-row constraint failures),
+    so their fields are slots and subclasses add no per-instance fields.
     """
     
+    __slots__ = ("message", "code", "sqlstate")
+    
     def __init__(self, message: str, code: Optional[int] = None, sqlstate: Optional[str] = None):
         """
         Initialize the error with message and optional error metadata.
@@ -51,6 +55,10 @@ class Error(Exception):
         self.message = message
         self.code = code
         self.sqlstate = sqlstate
+    
+    def __reduce__(self) -> tuple:
+        """Pickle support; slot values aren't part of the default exception state."""
+        return (self.__class__, (self.message, self.code, self.sqlstate))
 
 
 class InterfaceError(Error):
@@ -60,7 +68,8 @@ class InterfaceError(Error):
     These are errors in the driver itself, not the database.
     Examples: connection errors, protocol errors.
     """
-    pass
+    
+    __slots__ = ()
 
 
 class DatabaseError(Error):
@@ -69,7 +78,8 @@ class DatabaseError(Error):
     
     These are errors that come from the database server.
     """
-    pass
+    
+    __slots__ = ()
 
 
 class DataError(DatabaseError):
@@ -78,7 +88,8 @@ class DataError(DatabaseError):
     
     Examples: division by zero, numeric value out of range, invalid data type.
     """
-    pass
+    
+    __slots__ = ()
 
 
 class OperationalError(DatabaseError):
@@ -88,7 +99,8 @@ class OperationalError(DatabaseError):
     These errors are not necessarily under the control of the programmer.
     Examples: connection lost, database shutdown, transaction failed.
     """
-    pass
+    
+    __slots__ = ()
 
 
 class IntegrityError(DatabaseError):
@@ -97,7 +109,8 @@ class IntegrityError(DatabaseError):
     
     Examples: foreign key constraint violation, duplicate key.
     """
-    pass
+    
+    __slots__ = ()
 
 
 class InternalError(DatabaseError):
@@ -106,7 +119,8 @@ class InternalError(DatabaseError):
     
     Examples: cursor not valid anymore, transaction out of sync.
     """
-    pass
+    
+    __slots__ = ()
 
 
 class ProgrammingError(DatabaseError):
@@ -115,7 +129,8 @@ class ProgrammingError(DatabaseError):
     
     Examples: table not found, syntax error in SQL, wrong number of parameters.
     """
-    pass
+    
+    __slots__ = ()
 
 
 class NotSupportedError(DatabaseError):
@@ -124,7 +139,8 @@ class NotSupportedError(DatabaseError):
     
     Example: requesting a feature that FlyDB doesn't implement.
     """
-    pass
+    
+    __slots__ = ()
 
 
 # FlyDB-specific exceptions
@@ -135,7 +151,8 @@ class ConnectionError(InterfaceError):
     
     This includes initial connection failures and connection loss during operation.
     """
-    pass
+    
+    __slots__ = ()
 
 
 class ProtocolError(InterfaceError):
@@ -144,7 +161,8 @@ class ProtocolError(InterfaceError):
     
     Examples: invalid message format, unsupported protocol version, corrupted data.
     """
-    pass
+    
+    __slots__ = ()
 
 
 class AuthenticationError(OperationalError):
@@ -153,7 +171,8 @@ class AuthenticationError(OperationalError):
     
     This occurs when provided credentials are invalid or insufficient.
     """
-    pass
+    
+    __slots__ = ()
 
 
 class QueryError(DatabaseError):
@@ -162,7 +181,8 @@ class QueryError(DatabaseError):
     
     This is a general query error that doesn't fit other categories.
     """
-    pass
+    
+    __slots__ = ()
 
 
 class TransactionError(OperationalError):
@@ -171,7 +191,8 @@ class TransactionError(OperationalError):
     
     Examples: cannot start transaction, transaction already active, rollback failed.
     """
-    pass
+    
+    __slots__ = ()
 
 
 class CursorError(InterfaceError):
@@ -180,7 +201,8 @@ class CursorError(InterfaceError):
     
     Examples: cursor closed, invalid cursor state, fetch on non-SELECT.
     """
-    pass
+    
+    __slots__ = ()
 
 
 class PoolError(InterfaceError):
@@ -189,7 +211,8 @@ class PoolError(InterfaceError):
     
     Examples: pool exhausted, pool closed, invalid pool configuration.
     """
-    pass
+    
+    __slots__ = ()
 
 
 class TimeoutError(OperationalError):
@@ -198,4 +221,5 @@ class TimeoutError(OperationalError):
     
     Examples: connection timeout, query timeout, lock timeout.
     """
-    pass
+    
+    __slots__ = ()
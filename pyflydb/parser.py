@@ -23,10 +23,15 @@ with columns and rows. It handles various result formats including:
 - Error messages
 """
 
+import csv
 import re
 from typing import Any, Dict, List, Optional, Tuple
 
 
+# Values of the NULL and boolean keywords, matched case-insensitively
+KEYWORD_VALUES = {"NULL": None, "TRUE": True, "FALSE": False}
+
+
 class ResultParser:
     """
     Parser for FlyDB text format query results.
@@ -40,13 +45,12 @@ class ResultParser:
     This parser extracts structured data from these formats.
     """
     
-    # Patterns for different response types
-    INSERT_PATTERN = re.compile(r'^INSERT\s+(\d+)$')
-    UPDATE_PATTERN = re.compile(r'^UPDATE\s+(\d+)$')
-    DELETE_PATTERN = re.compile(r'^DELETE\s+(\d+)$')
-    CREATE_PATTERN = re.compile(r'^CREATE\s+\w+\s+OK$')
-    DROP_PATTERN = re.compile(r'^DROP\s+\w+\s+OK$')
-    ALTER_PATTERN = re.compile(r'^ALTER\s+\w+\s+OK$')
+    # Confirmation messages: "INSERT 1", "UPDATE 5", "DELETE 2" (with the
+    # affected row count) and "CREATE TABLE OK", "DROP ... OK", "ALTER ... OK",
+    # matched in a single pass
+    STATEMENT_PATTERN = re.compile(
+        r'^(?:(INSERT|UPDATE|DELETE)\s+(\d+)|(CREATE|DROP|ALTER)\s+\w+\s+OK)$'
+    )
     ROW_COUNT_PATTERN = re.compile(r'\((\d+)\s+rows?\)')
     
     @classmethod
@@ -75,66 +79,15 @@ class ResultParser:
                 "message": message
             }
         
-        # Check for INSERT
-        match = cls.INSERT_PATTERN.match(message)
-        if match:
-            return {
-                "columns": None,
-                "rows": [],
-                "row_count": int(match.group(1)),
-                "statement_type": "INSERT",
-                "message": message
-            }
-        
-        # Check for UPDATE
-        match = cls.UPDATE_PATTERN.match(message)
-        if match:
-            return {
-                "columns": None,
-                "rows": [],
-                "row_count": int(match.group(1)),
-                "statement_type": "UPDATE",
-                "message": message
-            }
-        
-        # Check for DELETE
-        match = cls.DELETE_PATTERN.match(message)
+        # Check for INSERT/UPDATE/DELETE/CREATE/DROP/ALTER
+        match = cls.STATEMENT_PATTERN.match(message)
         if match:
+            dml, count, ddl = match.groups()
             return {
                 "columns": None,
                 "rows": [],
-                "row_count": int(match.group(1)),
-                "statement_type": "DELETE",
-                "message": message
-            }
-        
-        # Check for CREATE
-        if cls.CREATE_PATTERN.match(message):
-            return {
-                "columns": None,
-                "rows": [],
-                "row_count": 0,
-                "statement_type": "CREATE",
-                "message": message
-            }
-        
-        # Check for DROP
-        if cls.DROP_PATTERN.match(message):
-            return {
-                "columns": None,
-                "rows": [],
-                "row_count": 0,
-                "statement_type": "DROP",
-                "message": message
-            }
-        
-        # Check for ALTER
-        if cls.ALTER_PATTERN.match(message):
-            return {
-                "columns": None,
-                "rows": [],
-                "row_count": 0,
-                "statement_type": "ALTER",
+                "row_count": int(count) if dml else 0,
+                "statement_type": dml or ddl,
                 "message": message
             }
         
@@ -185,12 +138,7 @@ class ResultParser:
         
         # First line might be data (no column headers in FlyDB)
         # Try to infer structure
-        rows = []
-        for line in lines:
-            if line.strip():
-                # Parse comma-separated values
-                values = cls._parse_row(line)
-                rows.append(values)
+        rows = cls._parse_rows([line for line in lines if line.strip()])
         
         # Extract columns (none provided, create generic names)
         columns = None
@@ -206,6 +154,43 @@ class ResultParser:
             "message": message
         }
     
+    @classmethod
+    def _parse_rows(cls, lines: List[str]) -> List[List[Any]]:
+        """
+        Parse rows of comma-separated values, one per line.
+        
+        A single csv.reader splits every row in C; double-quoted cells may
+        contain commas. A stray quote makes the reader run on into the
+        following lines, so those lines are split one by one with
+        _parse_row() instead, and a bad quote only affects its own row.
+        
+        Args:
+            lines: Non-blank row lines
+            
+        Returns:
+            List of rows of parsed values
+        """
+        parse_value = cls._parse_value
+        reader = csv.reader(lines, skipinitialspace=True)
+        rows = []
+        
+        try:
+            for row in reader:
+                start = len(rows)
+                if reader.line_num - start > 1:
+                    rows.extend(cls._parse_row(line) for line in lines[start:reader.line_num])
+                    continue
+                
+                # As with _parse_row(), nothing after the last comma is no cell
+                if lines[start].endswith(","):
+                    row.pop()
+                rows.append([parse_value(value) for value in row])
+        except csv.Error:
+            # E.g. a NUL character: split the remaining lines one by one
+            rows.extend(cls._parse_row(line) for line in lines[len(rows):])
+        
+        return rows
+    
     @classmethod
     def _parse_row(cls, line: str) -> List[Any]:
         """
@@ -217,25 +202,29 @@ class ResultParser:
         Returns:
             List of parsed values
         """
-        # Simple CSV parsing (handles basic cases)
+        # Simple CSV parsing (handles basic cases). Splitting on quotes gives
+        # alternating unquoted/quoted segments; only unquoted segments are
+        # split on commas, so each cell is sliced out once instead of being
+        # rebuilt character by character.
+        parse_value = cls._parse_value
         values = []
-        current = []
-        in_quotes = False
+        current = ""
         
-        for char in line:
-            if char == '"' and not in_quotes:
-                in_quotes = True
-            elif char == '"' and in_quotes:
-                in_quotes = False
-            elif char == ',' and not in_quotes:
-                values.append(cls._parse_value(''.join(current).strip()))
-                current = []
-            else:
-                current.append(char)
+        for index, segment in enumerate(line.split('"')):
+            if index % 2:
+                # Inside quotes: commas are part of the value
+                current += segment
+                continue
+            
+            parts = segment.split(',')
+            current += parts[0]
+            for part in parts[1:]:
+                values.append(parse_value(current.strip()))
+                current = part
         
         # Add last value
         if current:
-            values.append(cls._parse_value(''.join(current).strip()))
+            values.append(parse_value(current.strip()))
         
         return values
     
@@ -252,22 +241,22 @@ class ResultParser:
         """
         value = value.strip()
         
-        # Check for NULL
-        if value.upper() == 'NULL':
-            return None
-        
-        # Check for boolean
-        if value.upper() == 'TRUE':
-            return True
-        if value.upper() == 'FALSE':
-            return False
+        # Check for NULL and booleans, upper-casing the value once
+        keyword = value.upper()
+        if keyword in KEYWORD_VALUES:
+            return KEYWORD_VALUES[keyword]
         
         # Remove quotes if present
         if (value.startswith('"') and value.endswith('"')) or \
            (value.startswith("'") and value.endswith("'")):
             return value[1:-1]
         
-        # Try to parse as number
+        # Try to parse as number. Anything not ending in a digit or '.' can't
+        # be one, so most text values skip the failing conversion attempt.
+        last = value[-1:]
+        if not (last.isdecimal() or last == '.'):
+            return value
+        
         try:
             if '.' in value:
                 return float(value)
@@ -31,23 +31,62 @@ Header Fields:
     - Flags (1 byte): Message flags (compression, encryption, etc.)
     - Length (4 bytes): Payload length in big-endian format
     - Payload: Variable-length JSON-encoded message data
+
+Payloads may instead be encoded with MessagePack when the server advertises the
+``binary_v2`` capability and the connection negotiates it (see
+Connection(binary_protocol=True)). The header format is the same for both.
 """
 
 import json
 import struct
 from enum import IntEnum
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 from io import BytesIO
 
 from .exceptions import ProtocolError
 
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_dumps(payload: Dict[str, Any]) -> bytes:
+    """Encode a payload as UTF-8 JSON, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(payload)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib handles these
+    return json.dumps(payload).encode("utf-8")
+
+
+def _json_loads(data: Union[bytes, memoryview]) -> Any:
+    """Decode a UTF-8 JSON payload, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(bytes(data))
+
 
 # Protocol constants
 MAGIC_BYTE = 0xFD  # FlyDB magic byte
 PROTOCOL_VERSION = 0x01  # Current protocol version
 HEADER_SIZE = 8  # Size of the message header in bytes
+HEADER_STRUCT = struct.Struct(">BBBBI")  # magic, version, type, flags, length
 MAX_MESSAGE_SIZE = 16 * 1024 * 1024  # Maximum message size (16 MB)
 
+# Binary payload negotiation
+BINARY_CAPABILITY = "binary_v2"  # Server capability for MessagePack payloads
+PAYLOAD_ENCODING_OPTION = "payload_encoding"  # Session option selecting the encoding
+
 
 class MessageType(IntEnum):
     """
@@ -105,6 +144,11 @@ class MessageFlag(IntEnum):
     ENCRYPTED = 0x02
 
 
+# Enum members by wire value, looked up directly when decoding headers
+_MESSAGE_TYPES = {member.value: member for member in MessageType}
+_MESSAGE_FLAGS = {member.value: member for member in MessageFlag}
+
+
 class MessageHeader:
     """
     Represents a FlyDB protocol message header.
@@ -112,6 +156,8 @@ class MessageHeader:
     The header contains metadata about the message including type, size, and flags.
     """
     
+    __slots__ = ("magic", "version", "msg_type", "flags", "length")
+    
     def __init__(
         self,
         msg_type: MessageType,
@@ -150,8 +196,7 @@ class MessageHeader:
             raise ProtocolError(f"Message size {self.length} exceeds maximum {MAX_MESSAGE_SIZE}")
         
         # Pack header: 4 bytes + 4-byte length (big-endian)
-        return struct.pack(
-            ">BBBBI",
+        return HEADER_STRUCT.pack(
             self.magic,
             self.version,
             self.msg_type,
@@ -160,12 +205,15 @@ class MessageHeader:
         )
     
     @classmethod
-    def from_bytes(cls, data: bytes) -> "MessageHeader":
+    def from_bytes(cls, data: Union[bytes, bytearray, memoryview]) -> "MessageHeader":
         """
         Decode a header from bytes.
         
+        The header is unpacked in place, so a memoryview over a receive
+        buffer can be passed without copying it first.
+        
         Args:
-            data: 8-byte header data
+            data: Buffer starting with the 8-byte header data
             
         Returns:
             Decoded MessageHeader instance
@@ -176,7 +224,7 @@ class MessageHeader:
         if len(data) < HEADER_SIZE:
             raise ProtocolError(f"Invalid header size: {len(data)} bytes, expected {HEADER_SIZE}")
         
-        magic, version, msg_type, flags, length = struct.unpack(">BBBBI", data[:HEADER_SIZE])
+        magic, version, msg_type, flags, length = HEADER_STRUCT.unpack_from(data)
         
         # Validate magic byte
         if magic != MAGIC_BYTE:
@@ -192,22 +240,39 @@ class MessageHeader:
         if length > MAX_MESSAGE_SIZE:
             raise ProtocolError(f"Message size {length} exceeds maximum {MAX_MESSAGE_SIZE}")
         
+        # Validate message type and flags
+        if msg_type not in _MESSAGE_TYPES:
+            raise ProtocolError(f"Unknown message type: 0x{msg_type:02X}")
+        if flags not in _MESSAGE_FLAGS:
+            raise ProtocolError(f"Unknown message flags: 0x{flags:02X}")
+        
         return cls(
-            msg_type=MessageType(msg_type),
+            msg_type=_MESSAGE_TYPES[msg_type],
             length=length,
             magic=magic,
             version=version,
-            flags=MessageFlag(flags),
+            flags=_MESSAGE_FLAGS[flags],
         )
 
 
+@lru_cache(maxsize=None)
+def _empty_message_header(msg_type: MessageType) -> bytes:
+    """Encoded header of a message without payload (PING, COMMIT_TX, ...)."""
+    return MessageHeader(msg_type=msg_type, length=0).to_bytes()
+
+
 class Message:
     """
     Represents a complete FlyDB protocol message.
     
-    A message consists of a header and an optional JSON payload.
+    A message consists of a header and an optional JSON payload. The
+    encoded form is cached when the message is first sent, so a message can
+    be re-sent without encoding it again; don't modify the payload after
+    sending.
     """
     
+    __slots__ = ("msg_type", "payload", "_encoded")
+    
     def __init__(self, msg_type: MessageType, payload: Optional[Dict[str, Any]] = None):
         """
         Initialize a message.
@@ -218,37 +283,79 @@ class Message:
         """
         self.msg_type = msg_type
         self.payload = payload or {}
+        self._encoded: Optional[Tuple[bool, Tuple[bytes, bytes]]] = None
     
-    def to_bytes(self) -> bytes:
+    def to_bytes(self, binary: bool = False) -> bytes:
         """
         Encode the complete message to bytes.
         
+        Args:
+            binary: Encode the payload with MessagePack instead of JSON
+        
         Returns:
             Message in wire format (header + payload)
             
         Raises:
             ProtocolError: If encoding fails
         """
-        try:
-            # Encode payload as JSON
-            payload_bytes = json.dumps(self.payload).encode("utf-8") if self.payload else b""
+        header_bytes, payload_bytes = self.to_buffers(binary)
+        return header_bytes + payload_bytes
+    
+    def to_buffers(self, binary: bool = False) -> Tuple[bytes, bytes]:
+        """
+        Encode the message as separate header and payload buffers.
+        
+        Lets senders hand both buffers to a scatter-gather write without
+        first copying them into one bytes object.
+        
+        Args:
+            binary: Encode the payload with MessagePack instead of JSON
+        
+        Returns:
+            Tuple of (8-byte header, payload)
             
-            # Create and encode header
-            header = MessageHeader(msg_type=self.msg_type, length=len(payload_bytes))
-            header_bytes = header.to_bytes()
+        Raises:
+            ProtocolError: If encoding fails
+        """
+        if not self.payload:
+            return _empty_message_header(self.msg_type), b""
+        
+        encoded = self._encoded
+        if encoded is not None and encoded[0] == binary:
+            return encoded[1]
+        
+        try:
+            if binary:
+                payload_bytes = msgpack.packb(self.payload, use_bin_type=True)
+            else:
+                payload_bytes = _json_dumps(self.payload)
             
-            return header_bytes + payload_bytes
         except Exception as e:
             raise ProtocolError(f"Failed to encode message: {e}") from e
+        
+        length = len(payload_bytes)
+        if length > MAX_MESSAGE_SIZE:
+            raise ProtocolError(f"Message size {length} exceeds maximum {MAX_MESSAGE_SIZE}")
+        
+        # Pack the header directly, without a MessageHeader instance per message
+        header_bytes = HEADER_STRUCT.pack(
+            MAGIC_BYTE, PROTOCOL_VERSION, self.msg_type, MessageFlag.NONE, length
+        )
+        
+        self._encoded = (binary, (header_bytes, payload_bytes))
+        return header_bytes, payload_bytes
     
     @classmethod
-    def from_bytes(cls, header: MessageHeader, payload_data: bytes) -> "Message":
+    def from_bytes(
+        cls, header: MessageHeader, payload_data: Union[bytes, memoryview], binary: bool = False
+    ) -> "Message":
         """
         Decode a message from header and payload data.
         
         Args:
             header: Already-decoded message header
-            payload_data: Raw payload bytes
+            payload_data: Raw payload bytes (or a view of them)
+            binary: Decode the payload with MessagePack instead of JSON
             
         Returns:
             Decoded Message instance
@@ -257,19 +364,64 @@ class Message:
             ProtocolError: If decoding fails
         """
         try:
-            # Decode JSON payload if present
-            payload = json.loads(payload_data.decode("utf-8")) if payload_data else {}
+            if not payload_data:
+                payload = {}
+            elif binary:
+                payload = msgpack.unpackb(payload_data, raw=False)
+            else:
+                payload = _json_loads(payload_data)
             
             msg = cls(msg_type=header.msg_type, payload=payload)
             return msg
         except Exception as e:
             raise ProtocolError(f"Failed to decode message: {e}") from e
+    
+    @classmethod
+    def decode_stream(
+        cls, data: Union[bytes, bytearray, memoryview], binary: bool = False
+    ) -> Tuple[List["Message"], int]:
+        """
+        Decode every complete message at the start of a receive buffer.
+        
+        Lets a reader decode all messages delivered by one read instead of
+        waiting for each header and payload separately. A trailing partial
+        message is left for the caller to complete with more data.
+        
+        Args:
+            data: Buffer of received bytes, starting at a message boundary
+            binary: Decode payloads with MessagePack instead of JSON
+        
+        Returns:
+            Tuple of (decoded messages in order, number of bytes consumed)
+        
+        Raises:
+            ProtocolError: If a header or payload is invalid
+        """
+        messages = []
+        pos = 0
+        
+        with memoryview(data) as view:
+            end = len(view)
+            while end - pos >= HEADER_SIZE:
+                header = MessageHeader.from_bytes(view[pos:pos + HEADER_SIZE])
+                start = pos + HEADER_SIZE
+                if end - start < header.length:
+                    break
+                
+                pos = start + header.length
+                messages.append(cls.from_bytes(header, view[start:pos], binary))
+        
+        return messages, pos
 
 
 # Message creation helpers for common message types
 
-def create_auth_message(username: str, password: str) -> Message:
-    """Create an authentication message."""
+def create_auth_message(
+    username: str, password: Optional[str] = None, token: Optional[str] = None
+) -> Message:
+    """Create an authentication message with a password or a session token."""
+    if token is not None:
+        return Message(MessageType.AUTH, {"username": username, "token": token})
     return Message(MessageType.AUTH, {"username": username, "password": password})
 
 
@@ -293,6 +445,31 @@ def create_deallocate_message(name: str) -> Message:
     return Message(MessageType.DEALLOCATE, {"name": name})
 
 
+def create_cursor_open_message(
+    name: str,
+    query: str,
+    params: Optional[List[Any]] = None,
+    fetch_size: Optional[int] = None,
+) -> Message:
+    """Create a server-side cursor open message."""
+    payload: Dict[str, Any] = {"name": name, "query": query}
+    if params is not None:
+        payload["params"] = params
+    if fetch_size is not None:
+        payload["fetch_size"] = fetch_size
+    return Message(MessageType.CURSOR_OPEN, payload)
+
+
+def create_cursor_fetch_message(cursor_id: str, count: int) -> Message:
+    """Create a server-side cursor fetch message."""
+    return Message(MessageType.CURSOR_FETCH, {"cursor_id": cursor_id, "count": count})
+
+
+def create_cursor_close_message(cursor_id: str) -> Message:
+    """Create a server-side cursor close message."""
+    return Message(MessageType.CURSOR_CLOSE, {"cursor_id": cursor_id})
+
+
 def create_ping_message() -> Message:
     """Create a ping message."""
     return Message(MessageType.PING)
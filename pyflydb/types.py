@@ -19,7 +19,9 @@ This module provides type conversion and validation using Pydantic models,
 allowing for strongly-typed database results and better IDE support.
 """
 
-from typing import Any, Dict, List, Optional, Tuple, Union
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from datetime import datetime, date, time
 from decimal import Decimal
 
@@ -31,62 +33,206 @@ except ImportError:
     BaseModel = object  # Fallback
 
 
-class Row(dict):
+class Row(tuple):
     """
-    Enhanced row object with both dict and attribute access.
+    Enhanced row object with both name and attribute access.
     
     Allows accessing columns by name or index:
         row['name'] or row.name
         row[0]
+    
+    Rows are tuples, so they unpack, compare and hash like the plain tuples
+    returned by cursors. Each distinct set of column names gets its own
+    cached Row subclass with one property per column, so attribute access
+    is a direct tuple lookup and rows carry no per-instance dict.
+    
+    As with a dict, ``'name' in row`` checks the column names and
+    row.get('name') returns None for a missing column. Iterating yields the
+    values, and rows compare equal to tuples, not dicts; use row.to_dict()
+    for a dict. A column named like a Row method (keys, items, get,
+    columns, values, to_dict, to_tuple) is only reachable as row['name'].
+    If several columns share a name, the last one wins.
     """
     
-    def __init__(self, columns: List[str], values: Tuple[Any, ...]):
+    __slots__ = ()
+    
+    # Set on the per-schema subclasses created by _row_class()
+    _fields: Tuple[str, ...] = ()
+    _index: Dict[str, int] = {}
+    
+    def __new__(cls, columns: List[str], values: Tuple[Any, ...]) -> "Row":
         """
-        Initialize a row with column names and values.
+        Create a row with column names and values.
         
         Args:
             columns: List of column names
             values: Tuple of column values
         """
-        super().__init__(zip(columns, values))
-        self._columns = columns
-        self._values = values
+        return tuple.__new__(_row_class(tuple(columns)), values)
     
     def __getattr__(self, name: str) -> Any:
-        """Allow attribute-style access."""
-        try:
-            return self[name]
-        except KeyError:
-            raise AttributeError(f"Row has no column '{name}'")
+        """Fallback for names without a column property."""
+        raise AttributeError(f"Row has no column '{name}'")
     
-    def __getitem__(self, key: Union[str, int]) -> Any:
+    def __contains__(self, key: object) -> bool:
+        """Check whether the row has a column of this name."""
+        return key in self._index
+    
+    def __getitem__(self, key: Union[str, int, slice]) -> Any:
         """Allow both name and index access."""
-        if isinstance(key, int):
-            return self._values[key]
-        return super().__getitem__(key)
+        if isinstance(key, str):
+            try:
+                key = self._index[key]
+            except KeyError:
+                raise KeyError(key) from None
+        return tuple.__getitem__(self, key)
     
     def __repr__(self) -> str:
         """String representation."""
-        items = ', '.join(f"{k}={v!r}" for k, v in self.items())
+        items = ', '.join(f"{k}={v!r}" for k, v in zip(self._fields, self))
         return f"Row({items})"
     
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle support: rebuild through Row(columns, values)."""
+        return (Row, (list(self._fields), tuple(self)))
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a column value by name, or default if there is no such column."""
+        index = self._index.get(key)
+        if index is None:
+            return default
+        return tuple.__getitem__(self, index)
+    
+    def keys(self) -> List[str]:
+        """Get column names (allows dict(row) and **row)."""
+        return list(self._fields)
+    
+    def items(self) -> List[Tuple[str, Any]]:
+        """Get (column, value) pairs."""
+        return list(zip(self._fields, self))
+    
     @property
     def columns(self) -> List[str]:
         """Get column names."""
-        return self._columns
+        return list(self._fields)
     
     @property
     def values(self) -> Tuple[Any, ...]:
         """Get values as tuple."""
-        return self._values
+        return tuple(self)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to plain dictionary."""
-        return dict(self)
+        return dict(zip(self._fields, self))
     
     def to_tuple(self) -> Tuple[Any, ...]:
         """Convert to tuple."""
-        return self._values
+        return tuple(self)
+
+
+# Attributes columns can't replace: Row's own API and special or private
+# attributes. Columns named like tuple.count() or tuple.index() replace
+# those methods, as with the dict-based Row of 1.0
+_RESERVED_NAMES = frozenset(
+    name for name in dir(Row) if name.startswith("_") or name in vars(Row)
+)
+
+
+@lru_cache(maxsize=256)
+def _row_class(fields: Tuple[str, ...]) -> type:
+    """
+    Get the Row subclass for a set of column names.
+    
+    Each column becomes a property backed by operator.itemgetter, except
+    names reserved by Row (see _RESERVED_NAMES); those remain reachable by
+    name via row['name']. For duplicate names the last column wins, in
+    properties and lookups by name alike.
+    
+    Args:
+        fields: Column names in result order
+        
+    Returns:
+        Cached Row subclass for these columns
+    """
+    namespace: Dict[str, Any] = {
+        "__slots__": (),
+        "_fields": fields,
+        "_index": {name: i for i, name in enumerate(fields)},
+    }
+    for i, name in enumerate(fields):
+        if name not in _RESERVED_NAMES:
+            namespace[name] = property(itemgetter(i))
+    
+    return type("Row", (Row,), namespace)
+
+
+# Item types of arrays rendered without per-item dispatch
+_NUMERIC_TYPES = frozenset((int, float))
+_STR_TYPES = frozenset((str,))
+
+
+def _quote(value: str) -> str:
+    """Quote a string literal, escaping single quotes by doubling them."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _array_sql(value: Union[List[Any], Tuple[Any, ...]]) -> str:
+    """Render a list or tuple as an ARRAY literal."""
+    # Numeric and string arrays are rendered in one pass without per-item
+    # dispatch
+    types = set(map(type, value))
+    if types <= _NUMERIC_TYPES:
+        items = ', '.join(map(str, value))
+    elif types == _STR_TYPES:
+        items = ', '.join(map(_quote, value))
+    else:
+        items = ', '.join(map(TypeAdapter.to_sql, value))
+    return f"ARRAY[{items}]"
+
+
+def _json_sql(value: Dict[str, Any]) -> str:
+    """Render a dict as a JSON string literal."""
+    import json
+    return f"'{json.dumps(value)}'"
+
+
+def _to_sql_other(value: Any) -> str:
+    """Convert a value whose exact type has no entry in _TO_SQL."""
+    if value is None:
+        return "NULL"
+    elif isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    elif isinstance(value, (int, float, Decimal)):
+        return str(value)
+    elif isinstance(value, str):
+        return _quote(value)
+    elif isinstance(value, (datetime, date, time)):
+        return f"'{value.isoformat()}'"
+    elif isinstance(value, (list, tuple)):
+        return _array_sql(value)
+    elif isinstance(value, dict):
+        return _json_sql(value)
+    else:
+        # Fallback to string
+        return _quote(str(value))
+
+
+# SQL renderers by exact type, so converting a value of a common type is one
+# dict lookup; subclasses and other types go through _to_sql_other()
+_TO_SQL: Dict[type, Callable[[Any], str]] = {
+    type(None): lambda value: "NULL",
+    bool: lambda value: "TRUE" if value else "FALSE",
+    int: str,
+    float: str,
+    Decimal: str,
+    str: _quote,
+    datetime: lambda value: f"'{value.isoformat()}'",
+    date: lambda value: f"'{value.isoformat()}'",
+    time: lambda value: f"'{value.isoformat()}'",
+    list: _array_sql,
+    tuple: _array_sql,
+    dict: _json_sql,
+}
 
 
 class TypeAdapter:
@@ -107,33 +253,10 @@ class TypeAdapter:
         Returns:
             SQL string representation
         """
-        if value is None:
-            return "NULL"
-        elif isinstance(value, bool):
-            return "TRUE" if value else "FALSE"
-        elif isinstance(value, (int, float, Decimal)):
-            return str(value)
-        elif isinstance(value, str):
-            escaped = value.replace("'", "''")
-            return f"'{escaped}'"
-        elif isinstance(value, datetime):
-            return f"'{value.isoformat()}'"
-        elif isinstance(value, date):
-            return f"'{value.isoformat()}'"
-        elif isinstance(value, time):
-            return f"'{value.isoformat()}'"
-        elif isinstance(value, (list, tuple)):
-            # Array type
-            items = ', '.join(TypeAdapter.to_sql(v) for v in value)
-            return f"ARRAY[{items}]"
-        elif isinstance(value, dict):
-            # JSON type
-            import json
-            return f"'{json.dumps(value)}'"
-        else:
-            # Fallback to string
-            escaped = str(value).replace("'", "''")
-            return f"'{escaped}'"
+        to_sql = _TO_SQL.get(type(value))
+        if to_sql is not None:
+            return to_sql(value)
+        return _to_sql_other(value)
     
     @staticmethod
     def from_sql(value: Any, target_type: Optional[type] = None) -> Any:
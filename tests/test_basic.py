@@ -18,8 +18,12 @@ Basic test suite for pyFlyDb.
 Tests connection, authentication, query execution, and result handling.
 """
 
+import socket
+import threading
+
 import pytest
 import pyflydb
+from pyflydb.protocol import HEADER_SIZE, Message, MessageHeader, MessageType
 
 
 # Test configuration
@@ -29,9 +33,9 @@ TEST_USER = "admin"
 TEST_PASSWORD = "QPQUwwwC%%x#f2!8"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def connection():
-    """Create a test connection."""
+    """Create a test connection shared by all tests in this module."""
     conn = pyflydb.connect(
         host=TEST_HOST,
         port=TEST_PORT,
@@ -42,6 +46,127 @@ def connection():
     conn.close()
 
 
+@pytest.fixture(autouse=True)
+def reset_connection(request):
+    """Roll back the shared connection after each test that uses it."""
+    if "connection" not in request.fixturenames:
+        yield
+        return
+    
+    conn = request.getfixturevalue("connection")
+    yield
+    if not conn.closed:
+        # Drop statements a failed test left chained, then its transaction
+        conn._chain = None
+        conn.rollback()
+
+
+class FakeServer:
+    """
+    In-process stand-in for a FlyDB server, for protocol tests that need
+    no database.
+    
+    Queries are answered with one row holding the query text (or the
+    parameters of an EXECUTE), so the order of responses can be checked.
+    Queries containing BAD fail, as do transaction control messages
+    whose type is in ``failing``. Server-side cursors return CURSOR_ROWS
+    rows.
+    """
+    
+    CURSOR_ROWS = 5
+    
+    def __init__(self):
+        self.received = []
+        self.failing = set()
+        self._cursors = {}
+        self._listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._listener.bind(("127.0.0.1", 0))
+        self._listener.listen()
+        self.port = self._listener.getsockname()[1]
+        threading.Thread(target=self._serve, daemon=True).start()
+    
+    def connect(self, **kwargs):
+        """Open a client connection to this server."""
+        return pyflydb.connect(host="127.0.0.1", port=self.port, **kwargs)
+    
+    def close(self):
+        self._listener.close()
+    
+    def received_types(self):
+        return [message.msg_type for message in self.received]
+    
+    def _serve(self):
+        while True:
+            try:
+                sock, _ = self._listener.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._handle, args=(sock,), daemon=True).start()
+    
+    def _handle(self, sock):
+        with sock, sock.makefile("rb") as reader:
+            try:
+                while True:
+                    data = reader.read(HEADER_SIZE)
+                    if len(data) < HEADER_SIZE:
+                        return
+                    header = MessageHeader.from_bytes(data)
+                    message = Message.from_bytes(header, reader.read(header.length))
+                    self.received.append(message)
+                    sock.sendall(self.respond(message).to_bytes())
+            except OSError:
+                return  # Reset by a client closing with unread responses
+    
+    def respond(self, message):
+        msg_type = message.msg_type
+        payload = message.payload
+        if msg_type == MessageType.AUTH:
+            return Message(MessageType.AUTH_RESULT, {"success": True, "session_token": "token"})
+        if msg_type == MessageType.PING:
+            return Message(MessageType.PONG)
+        if msg_type in (MessageType.BEGIN_TX, MessageType.COMMIT_TX, MessageType.ROLLBACK_TX):
+            return Message(MessageType.TX_RESULT, {"success": msg_type not in self.failing})
+        if msg_type == MessageType.PREPARE:
+            return Message(MessageType.PREPARE_RESULT, {"success": True})
+        if msg_type == MessageType.GET_SERVER_INFO:
+            return Message(MessageType.SESSION_RESULT, {"version": "1.0", "capabilities": []})
+        if msg_type in (MessageType.CURSOR_OPEN, MessageType.CURSOR_FETCH):
+            if msg_type == MessageType.CURSOR_OPEN:
+                cursor_id, count = payload["name"], payload["fetch_size"]
+                self._cursors[cursor_id] = iter(range(self.CURSOR_ROWS))
+            else:
+                cursor_id, count = payload["cursor_id"], payload["count"]
+            rows = [[value] for _, value in zip(range(count), self._cursors[cursor_id])]
+            return Message(MessageType.CURSOR_RESULT, {
+                "cursor_id": cursor_id,
+                "columns": ["id"],
+                "rows": rows,
+                "has_more": len(rows) == count,
+            })
+        if msg_type == MessageType.CURSOR_CLOSE:
+            self._cursors.pop(payload["cursor_id"], None)
+            return Message(MessageType.CURSOR_RESULT, {"cursor_id": payload["cursor_id"]})
+        
+        query = payload.get("query", "")
+        if "BAD" in query:
+            return Message(MessageType.ERROR, {"message": "syntax error"})
+        row = payload.get("params") or [query]
+        return Message(MessageType.QUERY_RESULT, {
+            "success": True,
+            "columns": [f"column_{i}" for i in range(len(row))],
+            "rows": [row],
+            "row_count": 1,
+        })
+
+
+@pytest.fixture
+def fake_server():
+    """Start a fake FlyDB server for the duration of one test."""
+    server = FakeServer()
+    yield server
+    server.close()
+
+
 def test_connection():
     """Test basic connection establishment."""
     conn = pyflydb.connect(host=TEST_HOST, port=TEST_PORT, user=TEST_USER, password=TEST_PASSWORD)
@@ -204,6 +329,13 @@ def test_dsn_parsing():
     assert params["password"] == "secret"
     assert params["database"] == "mydb"
     
+    # Malformed URIs are split as urllib would; bad ports are rejected
+    assert parse_dsn("://host")["host"] == "localhost"
+    with pytest.raises(ValueError, match="out of range"):
+        parse_dsn("flydb://localhost:99999/db")
+    with pytest.raises(ValueError, match="could not be cast"):
+        parse_dsn("flydb://localhost:port/db")
+    
     # Key-value format
     params = parse_dsn("host=localhost port=8889 user=admin")
     assert params["host"] == "localhost"
@@ -238,10 +370,27 @@ def test_result_parser():
     # CREATE result
     result = ResultParser.parse_result("CREATE TABLE OK")
     assert result["statement_type"] == "CREATE"
+    
+    # SELECT result
+    result = ResultParser.parse_result('1, "Smith, Alice", 2.5\n2, NULL, TRUE\n(2 rows)')
+    assert result["statement_type"] == "SELECT"
+    assert result["row_count"] == 2
+    assert result["rows"] == [[1, "Smith, Alice", 2.5], [2, None, True]]
+    
+    # A stray quote only affects its own row
+    result = ResultParser.parse_result('1, "Smith, Alice\n2, NULL, TRUE\n(2 rows)')
+    assert result["statement_type"] == "SELECT"
+    assert result["rows"] == [[1, "Smith, Alice"], [2, None, True]]
+    
+    # Nothing after a trailing comma is no cell; whitespace is an empty one
+    result = ResultParser.parse_result('1, a,\n2, b, \n(2 rows)')
+    assert result["rows"] == [[1, "a"], [2, "b", ""]]
+    assert ResultParser._parse_row('1, a,') == [1, "a"]
 
 
 def test_type_adapter():
     """Test type adapter."""
+    from datetime import datetime
     from pyflydb.types import TypeAdapter
     
     # Test to_sql
@@ -251,6 +400,13 @@ def test_type_adapter():
     assert TypeAdapter.to_sql(42) == "42"
     assert TypeAdapter.to_sql("test") == "'test'"
     assert TypeAdapter.to_sql("it's") == "'it''s'"  # Escaped quote
+    assert TypeAdapter.to_sql([1, "a", None]) == "ARRAY[1, 'a', NULL]"
+    assert TypeAdapter.to_sql(datetime(2026, 1, 2, 3, 4)) == "'2026-01-02T03:04:00'"
+    
+    class Name(str):
+        pass
+    
+    assert TypeAdapter.to_sql(Name("it's")) == "'it''s'"  # Subclasses still converted
     
     # Test from_sql
     assert TypeAdapter.from_sql("42", int) == 42
@@ -258,6 +414,99 @@ def test_type_adapter():
     assert TypeAdapter.from_sql("TRUE", bool) is True
 
 
+def test_batch_insert_rendering():
+    """Test executemany folding INSERTs into multi-row statements."""
+    from pyflydb.cursor import Cursor
+    
+    cursor = Cursor(None)
+    cursor.max_batch_rows = 2
+    
+    batches = list(cursor._build_batch_inserts(
+        "INSERT INTO users VALUES (%s, %s)",
+        [(1, "Alice"), (2, "Bob"), (3, "it's")]
+    ))
+    assert batches == [
+        "INSERT INTO users VALUES (1, 'Alice'), (2, 'Bob')",
+        "INSERT INTO users VALUES (3, 'it''s')",
+    ]
+    
+    # Non-INSERT statements fall back to one execute per parameter set
+    assert cursor._build_batch_inserts("UPDATE users SET age = %s", [(1,)]) is None
+    
+    # Only a single VALUES row with nothing after it is folded
+    assert cursor._build_batch_inserts(
+        "INSERT INTO t (a) VALUES (%s) RETURNING (a)", [(1,), (2,)]
+    ) is None
+    assert cursor._build_batch_inserts("INSERT INTO t VALUES (1), (%s)", [(1,), (2,)]) is None
+    assert list(cursor._build_batch_inserts("INSERT INTO t VALUES (%s, ')')", [(1,)])) == [
+        "INSERT INTO t VALUES (1, ')')"
+    ]
+
+
+def test_parameter_substitution():
+    """Test client-side parameter substitution."""
+    from pyflydb.cursor import Cursor
+    
+    cursor = Cursor(None)
+    
+    assert cursor._substitute_parameters(
+        "INSERT INTO users VALUES (%s, %s, %s)", [1, "O'Brien", None]
+    ) == "INSERT INTO users VALUES (1, 'O''Brien', NULL)"
+    
+    assert cursor._substitute_parameters(
+        "SELECT * FROM users WHERE name = %(name)s AND note LIKE '10%%'",
+        {"name": "Bob"}
+    ) == "SELECT * FROM users WHERE name = 'Bob' AND note LIKE '10%'"
+    
+    with pytest.raises(pyflydb.ProgrammingError):
+        cursor._substitute_parameters("SELECT %(missing)s", {"name": "Bob"})
+    
+    assert cursor.mogrify(
+        "SELECT * FROM users WHERE id = %s", (7,)
+    ) == "SELECT * FROM users WHERE id = 7"
+    assert cursor.mogrify("SELECT '100%'") == "SELECT '100%'"
+
+
+def test_server_placeholders():
+    """Test rewriting pyformat placeholders for prepared statements."""
+    from pyflydb.cursor import Cursor
+    
+    cursor = Cursor(None)
+    
+    query, values = cursor._to_server_placeholders(
+        "UPDATE users SET age = %s WHERE name = %s", (31, "Alice")
+    )
+    assert query == "UPDATE users SET age = $1 WHERE name = $2"
+    assert values == [31, "Alice"]
+    
+    query, values = cursor._to_server_placeholders(
+        "SELECT * FROM users WHERE name = %(name)s OR nick = %(name)s AND pct > 5%%",
+        {"name": "Bob"}
+    )
+    assert query == "SELECT * FROM users WHERE name = $1 OR nick = $1 AND pct > 5%"
+    assert values == ["Bob"]
+    
+    with pytest.raises(pyflydb.ProgrammingError):
+        cursor._to_server_placeholders("SELECT %s, %s", (1,))
+
+
+def test_fetch_numpy():
+    """Test columnar fetch into NumPy arrays."""
+    np = pytest.importorskip("numpy")
+    from pyflydb.cursor import Cursor
+    
+    cursor = Cursor(None)
+    cursor._columns = ["id", "score", "name"]
+    cursor._rows = [[1, 2.5, "Alice"], [2, 3, None]]
+    
+    columns = cursor.fetch_numpy()
+    assert columns["id"].dtype == np.int64
+    assert columns["score"].dtype == np.float64
+    assert columns["name"].dtype == object
+    assert columns["id"].tolist() == [1, 2]
+    assert cursor.fetchone() is None
+
+
 def test_row_object():
     """Test Row object."""
     from pyflydb.types import Row
@@ -281,6 +530,61 @@ def test_row_object():
     assert row.values == (1, "Alice", 30)
     assert row.to_tuple() == (1, "Alice", 30)
     assert row.to_dict() == {"id": 1, "name": "Alice", "age": 30}
+    
+    # Rows are tuples and share one class per set of columns
+    assert row == (1, "Alice", 30)
+    assert dict(row) == {"id": 1, "name": "Alice", "age": 30}
+    assert type(row) is type(Row(["id", "name", "age"], (2, "Bob", 25)))
+    
+    # Dict-style lookups check column names
+    assert "name" in row and "Alice" not in row
+    assert row.get("age") == 30 and row.get("email") is None
+    
+    # Columns win over tuple methods but not over the Row API; the last of
+    # several columns with one name wins
+    row = Row(["count", "index", "x", "x", "keys"], (5, 6, 1, 2, 9))
+    assert (row.count, row.index, row.x, row["x"]) == (5, 6, 2, 2)
+    assert row.keys() == ["count", "index", "x", "x", "keys"] and row["keys"] == 9
+
+
+def test_pool_bounds():
+    """Test connection pool configuration validation."""
+    with pytest.raises(pyflydb.PoolError):
+        pyflydb.ConnectionPool(host=TEST_HOST, port=TEST_PORT, min_size=4, max_size=2)
+    
+    pool = pyflydb.ConnectionPool(host=TEST_HOST, port=TEST_PORT, min_size=0, max_size=2)
+    assert pool.size == 0
+    pool.close()
+    assert pool.closed
+    with pytest.raises(pyflydb.PoolError):
+        pool.getconn()
+
+
+def test_message_roundtrip():
+    """Test encoding and decoding protocol messages."""
+    from pyflydb.protocol import Message, MessageHeader, MessageType, HEADER_SIZE, MSGPACK_AVAILABLE
+    
+    message = Message(MessageType.EXECUTE, {"name": "stmt", "params": [1, None, "x"]})
+    
+    for binary in ([False, True] if MSGPACK_AVAILABLE else [False]):
+        data = message.to_bytes(binary)
+        header = MessageHeader.from_bytes(data[:HEADER_SIZE])
+        assert header.msg_type == MessageType.EXECUTE
+        assert header.length == len(data) - HEADER_SIZE
+        
+        decoded = Message.from_bytes(header, data[HEADER_SIZE:], binary)
+        assert decoded.payload == message.payload
+        
+        # Complete messages are decoded from one buffer; a partial one is left
+        stream = data + Message(MessageType.PING).to_bytes(binary) + data[:HEADER_SIZE + 1]
+        messages, consumed = Message.decode_stream(stream, binary)
+        assert [m.msg_type for m in messages] == [MessageType.EXECUTE, MessageType.PING]
+        assert messages[0].payload == message.payload
+        assert consumed == len(data) + HEADER_SIZE
+    
+    # Unknown message types are protocol errors
+    with pytest.raises(pyflydb.ProtocolError):
+        MessageHeader.from_bytes(b"\xfd\x01\xee\x00\x00\x00\x00\x00")
 
 
 def test_exception_hierarchy():
@@ -290,6 +594,12 @@ def test_exception_hierarchy():
     assert issubclass(pyflydb.ConnectionError, pyflydb.InterfaceError)
     assert issubclass(pyflydb.AuthenticationError, pyflydb.OperationalError)
     assert issubclass(pyflydb.QueryError, pyflydb.DatabaseError)
+    
+    # Error fields survive pickling (e.g. across multiprocessing workers)
+    import pickle
+    error = pickle.loads(pickle.dumps(pyflydb.IntegrityError("duplicate key", code=23, sqlstate="23505")))
+    assert type(error) is pyflydb.IntegrityError
+    assert (str(error), error.code, error.sqlstate) == ("duplicate key", 23, "23505")
 
 
 def test_dbapi_attributes():
@@ -299,5 +609,295 @@ def test_dbapi_attributes():
     assert pyflydb.paramstyle == "pyformat"
 
 
+def test_rejected_begin(fake_server):
+    """Test that a write is never sent along with a BEGIN that fails."""
+    fake_server.failing.add(MessageType.BEGIN_TX)
+    with fake_server.connect() as conn:
+        cursor = conn.cursor()
+        conn.begin()
+        with pytest.raises(pyflydb.TransactionError):
+            cursor.execute("INSERT INTO t VALUES (1)")
+        
+        # The INSERT did not reach the server and no transaction is active
+        assert fake_server.received_types() == [MessageType.BEGIN_TX]
+        assert not conn._in_transaction
+        
+        # A read goes out together with BEGIN; the failure is still reported
+        conn.begin()
+        with pytest.raises(pyflydb.TransactionError):
+            cursor.execute("SELECT 1")
+        assert not conn._in_transaction
+        
+        fake_server.failing.clear()
+        conn.begin()
+        cursor.execute("INSERT INTO t VALUES (1)")
+        assert conn._in_transaction
+        conn.commit()
+        assert fake_server.received_types()[-3:] == [
+            MessageType.BEGIN_TX, MessageType.QUERY, MessageType.COMMIT_TX
+        ]
+
+
+def test_pipelined_results(fake_server):
+    """Test that pipelined responses are matched to their requests."""
+    from pyflydb.protocol import create_query_message
+    
+    with fake_server.connect() as conn:
+        handles = [conn.send_async(create_query_message(f"SELECT {i}")) for i in range(5)]
+        
+        # Fetching out of order buffers the responses before it
+        assert conn.fetch(handles[3]).payload["rows"] == [["SELECT 3"]]
+        for i in (0, 1, 2, 4):
+            assert conn.fetch(handles[i]).payload["rows"] == [[f"SELECT {i}"]]
+        with pytest.raises(pyflydb.InterfaceError):
+            conn.fetch(handles[0])
+        
+        # A blocking request reads outstanding responses first
+        handle = conn.send_async(create_query_message("SELECT 5"))
+        cursor = conn.cursor()
+        cursor.execute("SELECT 6")
+        assert cursor.fetchall() == [("SELECT 6",)]
+        assert conn.fetch(handle).payload["rows"] == [["SELECT 5"]]
+
+
+def test_chain(fake_server):
+    """Test buffering statements with chain() and sending them with end_chain()."""
+    with fake_server.connect() as conn:
+        cursor = conn.cursor()
+        conn.begin()
+        conn.chain()
+        cursor.execute("INSERT INTO t VALUES (1)")
+        cursor.execute("UPDATE t SET a = 2")
+        with pytest.raises(pyflydb.ProgrammingError):
+            cursor.execute("SELECT 1")
+        
+        # Nothing is sent until the chain ends
+        assert fake_server.received == []
+        assert conn.end_chain() == 2
+        conn.rollback()
+        assert fake_server.received_types() == [
+            MessageType.BEGIN_TX, MessageType.QUERY, MessageType.QUERY, MessageType.ROLLBACK_TX
+        ]
+        
+        # A failed statement is reported once every response has been read
+        conn.chain()
+        cursor.execute("UPDATE BAD SET a = 1")
+        cursor.execute("INSERT INTO t VALUES (2)")
+        with pytest.raises(pyflydb.DatabaseError):
+            conn.end_chain()
+        assert conn.ping()
+
+
+def test_deferred_ack_error(fake_server):
+    """Test that a failed COMMIT sent without waiting doesn't fail the next request."""
+    with fake_server.connect() as conn:
+        cursor = conn.cursor()
+        conn.begin()
+        cursor.execute("SELECT 1")
+        
+        # A read-only transaction is committed without waiting
+        fake_server.failing.add(MessageType.COMMIT_TX)
+        conn.commit()
+        assert not conn._in_transaction
+        
+        # The next statement has run and its result is returned, but the
+        # connection can't be used any more
+        cursor.execute("INSERT INTO t VALUES (1)")
+        assert cursor.fetchall() == [("INSERT INTO t VALUES (1)",)]
+        assert conn.closed
+        with pytest.raises(pyflydb.InterfaceError, match="Commit failed"):
+            conn._send_message(Message(MessageType.PING))
+
+
+def test_server_info_cache(fake_server):
+    """Test that server info is fetched once per server and handed out as copies."""
+    with fake_server.connect() as conn:
+        info = conn.get_server_info()
+        info["capabilities"].append("changed")
+        assert conn.get_server_info() == {"version": "1.0", "capabilities": []}
+    
+    with fake_server.connect() as conn:
+        assert conn.get_server_info() == {"version": "1.0", "capabilities": []}
+    assert fake_server.received_types().count(MessageType.GET_SERVER_INFO) == 1
+
+
+def test_large_payload(fake_server):
+    """Test receiving responses larger than the receive buffer."""
+    from pyflydb.connection import RECV_BUFFER_SIZE
+    from pyflydb.protocol import create_query_message
+    
+    with fake_server.connect() as conn:
+        large = "SELECT '" + "x" * (3 * RECV_BUFFER_SIZE) + "'"
+        queries = ["SELECT 1", large, "SELECT 2", large]
+        handles = [conn.send_async(create_query_message(query)) for query in queries]
+        for handle, query in zip(handles, queries):
+            assert conn.fetch(handle).payload["rows"] == [[query]]
+
+
+def test_session_token(fake_server):
+    """Test that reconnecting with the same credentials presents the session token."""
+    def auth_payloads():
+        return [m.payload for m in fake_server.received if m.msg_type == MessageType.AUTH]
+    
+    fake_server.connect(user="admin", password="secret").close()
+    fake_server.connect(user="admin", password="secret").close()
+    assert auth_payloads()[0]["password"] == "secret"
+    assert auth_payloads()[1] == {"username": "admin", "token": "token"}
+    
+    # The token is not reused for a different password
+    fake_server.connect(user="admin", password="other").close()
+    assert auth_payloads()[2]["password"] == "other"
+
+
+def test_named_cursor(fake_server):
+    """Test streaming rows through a server-side cursor."""
+    with fake_server.connect() as conn:
+        cursor = conn.cursor(name="stream")
+        cursor.itersize = 2
+        cursor.execute("SELECT id FROM t")
+        assert [row[0] for row in cursor] == list(range(FakeServer.CURSOR_ROWS))
+        assert cursor.description[0][0] == "id"
+        cursor.close()
+        assert fake_server.received_types() == [
+            MessageType.CURSOR_OPEN,
+            MessageType.CURSOR_FETCH,
+            MessageType.CURSOR_FETCH,
+            MessageType.CURSOR_CLOSE,
+        ]
+
+
+def test_async_cursor(fake_server):
+    """Test concurrent AsyncCursor queries over one AsyncConnection."""
+    import asyncio
+    from pyflydb import aio
+    
+    async def run():
+        conn = await aio.connect(host="127.0.0.1", port=fake_server.port)
+        try:
+            cursors = [conn.cursor() for _ in range(3)]
+            await asyncio.gather(
+                *(cursor.execute(f"SELECT {i}") for i, cursor in enumerate(cursors))
+            )
+            results = [cursor.fetchall() for cursor in cursors]
+            
+            await cursors[0].execute("SELECT %s, %s", (7, "x"))
+            results.append(cursors[0].fetchall())
+            return results
+        finally:
+            await conn.close()
+    
+    assert asyncio.run(run()) == [
+        [("SELECT 0",)], [("SELECT 1",)], [("SELECT 2",)], [(7, "x")]
+    ]
+
+
+def test_async_send_failure(fake_server):
+    """Test that a failed send fails waiting requests and closes the connection."""
+    import asyncio
+    from pyflydb import aio
+    
+    async def run():
+        conn = await aio.connect(host="127.0.0.1", port=fake_server.port)
+        try:
+            async def broken_drain():
+                raise ConnectionResetError("reset by peer")
+            
+            conn._writer.drain = broken_drain
+            with pytest.raises(pyflydb.ConnectionError):
+                await conn.request(Message(MessageType.PING))
+            
+            # Nothing is left waiting and later requests fail at once
+            assert conn.closed and not conn._pending
+            with pytest.raises(pyflydb.InterfaceError):
+                await conn.request(Message(MessageType.PING))
+        finally:
+            await conn.close()
+    
+    asyncio.run(run())
+
+
+def test_pool_discards_dirty_connections(fake_server):
+    """Test that connections returned with unfinished work are not reused."""
+    from pyflydb.protocol import create_query_message
+    
+    pool = pyflydb.ConnectionPool(host="127.0.0.1", port=fake_server.port, min_size=0, max_size=1)
+    
+    conn = pool.getconn()
+    conn.chain()
+    conn.cursor().execute("INSERT INTO t VALUES (1)")
+    pool.putconn(conn)
+    assert conn.closed and pool.size == 0
+    
+    conn = pool.getconn()
+    conn.send_async(create_query_message("SELECT 1"))
+    pool.putconn(conn)
+    assert conn.closed and pool.size == 0
+    
+    conn = pool.getconn()
+    pool.putconn(conn)
+    assert not conn.closed
+    assert pool.getconn() is conn
+    
+    # Only connections checked out from this pool can be returned, once
+    pool.putconn(conn)
+    with pytest.raises(pyflydb.PoolError):
+        pool.putconn(conn)
+    with fake_server.connect() as foreign:
+        with pytest.raises(pyflydb.PoolError):
+            pool.putconn(foreign)
+    assert pool.size == 1
+    pool.close()
+
+
+def test_pool_min_size(fake_server):
+    """Test that the pool reopens discarded connections up to min_size."""
+    import time
+    
+    def wait_for_idle(count):
+        deadline = time.monotonic() + 5
+        while pool._idle.qsize() < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return pool._idle.qsize()
+    
+    with pyflydb.ConnectionPool(host="127.0.0.1", port=fake_server.port, min_size=2, max_size=3) as pool:
+        assert pool.size == 2 and wait_for_idle(2) == 2
+        
+        conn = pool.getconn()
+        conn.close()
+        pool.putconn(conn)
+        assert pool.size == 2 and wait_for_idle(2) == 2
+        
+        # Connections above min_size are not replaced
+        conns = [pool.getconn() for _ in range(3)]
+        conns[0].close()
+        for conn in conns:
+            pool.putconn(conn)
+        assert pool.size == 2
+
+
+def test_executemany_generator(fake_server):
+    """Test executemany() with a generator of parameter sets."""
+    with fake_server.connect() as conn:
+        cursor = conn.cursor()
+        cursor.executemany("UPDATE t SET a = %s", ((i,) for i in range(3)))
+        assert fake_server.received_types().count(MessageType.EXECUTE) == 3
+        
+        cursor.executemany("INSERT INTO t VALUES (%s)", iter([(1,), (2,)]))
+        assert fake_server.received[-1].payload["query"] == "INSERT INTO t VALUES (1), (2)"
+
+
+def test_structured_result(fake_server):
+    """Test that only results with rows and columns skip text parsing."""
+    with fake_server.connect() as conn:
+        cursor = conn.cursor()
+        cursor._handle_query_result({"success": True, "columns": ["id"], "rows": [[1], [2]]})
+        assert cursor.fetchall() == [(1,), (2,)]
+        assert cursor.description[0][0] == "id"
+        
+        # Without columns the text table in the message is parsed instead
+        cursor._handle_query_result({"success": True, "rows": [], "message": "1, 'a'\n(1 rows)"})
+        assert cursor.fetchall() == [(1, "a")]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])